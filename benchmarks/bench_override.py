@@ -0,0 +1,106 @@
+'''
+	Micro-benchmark of UnitTest.override and of the functions decorated with initUT
+	Compares the cost per call of the real function called directly with the same call going through "override" or "initUT"
+
+	python benchmarks/bench_override.py [number_of_calls]
+'''
+
+import os, sys, timeit
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BASE_DIR))
+
+from unit_test_advanced.UnitTest import UnitTest, DisabledUnitTest
+from unit_test_advanced.functools import initUT
+
+
+def imagineThisIsAnApiCall(myParam):
+	return myParam
+
+
+@initUT
+def decoratedWithUT(myParam, UT = None):
+	return myParam
+
+
+@initUT
+def decoratedWithoutUT(myParam):
+	return myParam
+
+
+class fakeApiCallAction:
+
+	def fakeApiCall(self, myParam):
+		return myParam
+
+
+class noFakeAction:
+	pass
+
+
+def _timePerCall(statement, namespace, number, repeat = 5):
+	'''
+		Best time of "repeat" runs, in nanoseconds per call
+	'''
+
+	return min(timeit.repeat(statement, globals= namespace, number= number, repeat= repeat)) / number * 1e9
+
+
+def _timeInPlan(action, statement, namespace, number):
+	'''
+		Same as _timePerCall, from the trigger of "action" while its plan is running: "UT" is the UnitTest executing it
+	'''
+
+	timings = []
+
+	def trigger(UT, **kwargs):
+		timings.append(_timePerCall(statement, {**namespace, 'UT': UT}, number))
+
+	UnitTest(is_enabled= True).execute([[type(action.__name__, (action,), {'trigger': staticmethod(trigger)})]])
+	return timings[0]
+
+
+def run(number = 1_000_000):
+	UT_disabled = UnitTest(is_enabled= False)
+	UT_readonly = DisabledUnitTest()
+	UT_enabled  = UnitTest(is_enabled= True)
+	UT_fake     = UnitTest(is_enabled= True)
+	UT_timed    = UnitTest(is_enabled= True, time_overrides= True)
+
+	# Outside of a plan, the test-class set here is the one "override" looks up
+	UT_fake._pooltest = fakeApiCallAction()
+
+	namespace = {
+		'imagineThisIsAnApiCall' : imagineThisIsAnApiCall,
+		'decoratedWithUT'        : decoratedWithUT,
+		'decoratedWithoutUT'     : decoratedWithoutUT,
+		'UT_disabled'            : UT_disabled,
+		'UT_readonly'            : UT_readonly,
+		'UT_enabled'             : UT_enabled,
+		'UT_fake'                : UT_fake,
+		'UT_timed'               : UT_timed,
+	}
+
+	results = {
+		'bare call'                     : _timePerCall("imagineThisIsAnApiCall(myParam= 'value')", namespace, number),
+		'override disabled'             : _timePerCall("UT_disabled.override('fakeApiCall', imagineThisIsAnApiCall, myParam= 'value')", namespace, number),
+		'override DisabledUnitTest'     : _timePerCall("UT_readonly.override('fakeApiCall', imagineThisIsAnApiCall, myParam= 'value')", namespace, number),
+		'override enabled (no fake)'    : _timePerCall("UT_enabled.override('fakeApiCall', imagineThisIsAnApiCall, myParam= 'value')", namespace, number),
+		'override enabled (fake)'       : _timePerCall("UT_fake.override('fakeApiCall', imagineThisIsAnApiCall, myParam= 'value')", namespace, number),
+		'override timed (no fake)'      : _timePerCall("UT_timed.override('fakeApiCall', imagineThisIsAnApiCall, myParam= 'value')", namespace, number),
+		'override in plan (no fake)'    : _timeInPlan(noFakeAction, "UT.override('fakeApiCall', imagineThisIsAnApiCall, myParam= 'value')", namespace, number),
+		'override in plan (fake)'       : _timeInPlan(fakeApiCallAction, "UT.override('fakeApiCall', imagineThisIsAnApiCall, myParam= 'value')", namespace, number),
+		'initUT (UT injected)'          : _timePerCall("decoratedWithUT(myParam= 'value')", namespace, number),
+		'initUT (UT passed)'            : _timePerCall("decoratedWithUT(myParam= 'value', UT= UT_enabled)", namespace, number),
+		'initUT (UT dropped)'           : _timePerCall("decoratedWithoutUT(myParam= 'value', UT= UT_enabled)", namespace, number),
+	}
+
+	bare = results['bare call']
+	for name, duration in results.items():
+		print(f'{name:30} {duration:8.1f} ns/call    overhead {duration - bare:8.1f} ns/call')
+
+	return results
+
+
+if __name__ == '__main__':
+	run(*[int(arg) for arg in sys.argv[1:2]])
@@ -0,0 +1,89 @@
+'''
+	Benchmark of the plan generation on a synthetic graph (see graphs.py): estimation, infinite loop check, preparation,
+	deduplication and execution of test-classes doing nothing
+
+	python benchmarks/bench_plans.py [depth] [width] [fan_out] [algorithm]
+'''
+
+import os, sys, timeit
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BASE_DIR))
+sys.path.insert(0, BASE_DIR)
+
+from unit_test_advanced.UnitTest import UnitTest
+from graphs import makeGraph
+
+
+def _bestTime(function, repeat):
+	'''
+		Best time of "repeat" runs, in seconds
+	'''
+
+	return min(timeit.repeat(function, number= 1, repeat= repeat))
+
+
+def run(depth = 8, width = 50, fan_out = 2, algorithm = 'all', execute_limit = 2000, repeat = 3):
+	'''
+		The test-classes of the two middle levels are passed to "preparePlans": the plans going through both are duplicated.
+		Only the first "execute_limit" plans are executed
+	'''
+
+	levels      = makeGraph(depth, width, fan_out)
+	roots       = levels[depth // 2 - 1] + levels[depth // 2]
+	settings    = {'is_enabled': True, 'parent_execution_plan': algorithm, 'children_execution_plan': algorithm, 'random_seed': 0}
+
+	def newUnitTest():
+		return UnitTest(**settings)
+
+	def estimate():
+		return newUnitTest().estimatePlans(roots)
+
+	def checkLoops():
+		UT = newUnitTest()
+		for root in roots:
+			UT._getRoot(root)
+
+	def prepare():
+		UT = newUnitTest()
+		UT.preparePlans(roots)
+		return UT.getExecutionPlans()
+
+	estimated   = estimate()
+	plans       = prepare()
+	duplicated  = plans + plans
+
+	def deduplicate():
+		UT = newUnitTest()
+		UT.preparePlans(duplicated)
+
+	executed = plans[:execute_limit]
+
+	def execute():
+		newUnitTest().execute(executed)
+
+	def executeSharingPrefixes():
+		newUnitTest().execute(executed, share_prefixes= True)
+
+	results = {
+		'estimatePlans'                 : _bestTime(estimate, repeat),
+		'infinite loop check'           : _bestTime(checkLoops, repeat),
+		'preparePlans'                  : _bestTime(prepare, repeat),
+		'deduplication'                 : _bestTime(deduplicate, repeat),
+		'execute (no-op)'               : _bestTime(execute, repeat),
+		'execute (no-op, shared)'       : _bestTime(executeSharingPrefixes, repeat),
+	}
+
+	print(f'{depth * width} test-classes, {estimated["plans"]} plans estimated, {len(plans)} distinct plans, {len(executed)} executed')
+	for name, duration in results.items():
+		print(f'{name:30} {duration * 1000:10.1f} ms')
+
+	return {
+		'graph'     : {'depth': depth, 'width': width, 'fan_out': fan_out, 'algorithm': algorithm, 'classes': depth * width, 'plans': len(plans), 'executed_plans': len(executed)},
+		'seconds'   : results,
+	}
+
+
+if __name__ == '__main__':
+	args = sys.argv[1:5]
+	run(*[int(arg) for arg in args[:3]], *args[3:])
@@ -0,0 +1,31 @@
+'''
+	Synthetic relationship graphs for the benchmarks, built like the "relationExample_lvl*" test-classes of examples/scenarios.py
+'''
+
+import random, sys, types
+
+
+def makeGraph(depth = 8, width = 50, fan_out = 2, seed = 0):
+	'''
+		Registers a module of "depth" x "width" test-classes named "lvl{level}_{index}".
+		Each test-class has "fan_out" children drawn on the next level, declared as import paths, with the matching "dependencies".
+		Returns the test-classes of each level
+	'''
+
+	name    = f'bench_graph_{depth}_{width}_{fan_out}_{seed}'
+	module  = types.ModuleType(name)
+	rng     = random.Random(seed)
+
+	levels = [[type(f'lvl{level}_{idx}', (), {'__module__': name, 'dependencies': [], 'children': []}) for idx in range(width)] for level in range(depth)]
+	for level in range(depth - 1):
+		for cls in levels[level]:
+			for child in rng.sample(levels[level + 1], min(fan_out, width)):
+				cls.children.append(f'{name}.{child.__name__}')
+				child.dependencies.append(f'{name}.{cls.__name__}')
+
+	for level in levels:
+		for cls in level:
+			setattr(module, cls.__name__, cls)
+
+	sys.modules[name] = module
+	return levels
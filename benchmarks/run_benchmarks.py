@@ -0,0 +1,77 @@
+'''
+	Runs all the benchmarks and writes their results as JSON, to compare them across commits
+
+	python benchmarks/run_benchmarks.py --output bench_output.txt
+	python benchmarks/run_benchmarks.py --compare bench_output.txt
+'''
+
+import argparse, json, os, platform, subprocess, sys
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BASE_DIR)
+
+import bench_override, bench_plans
+
+
+def _getCommit():
+	'''
+		Commit of the working copy, None outside of a git repository
+	'''
+
+	try:
+		return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd= BASE_DIR, capture_output= True, text= True, check= True).stdout.strip()
+	except (OSError, subprocess.CalledProcessError):
+		return None
+
+
+def compare(baseline, results):
+	'''
+		Ratio of each timing to the same timing in the baseline. Above 1, the current commit is slower
+	'''
+
+	if baseline.get('graph') != results['graph']:
+		print(f'Warning: the baseline was run on another graph {baseline.get("graph")}')
+
+	for benchmark in ('plans', 'override'):
+		print(f'-- {benchmark}')
+		for name, value in results[benchmark].items():
+			if name in baseline.get(benchmark, {}):
+				print(f'{name:30} {value / baseline[benchmark][name]:6.2f}x')
+
+
+def main():
+	parser = argparse.ArgumentParser(description= 'Benchmarks of unit_test_advanced')
+	parser.add_argument('--depth', type= int, default= 8, help= 'Levels of test-classes in the synthetic graph')
+	parser.add_argument('--width', type= int, default= 50, help= 'Test-classes per level')
+	parser.add_argument('--fan-out', type= int, default= 2, help= 'Children of each test-class')
+	parser.add_argument('--algorithm', default= 'all', help= 'parent_execution_plan and children_execution_plan')
+	parser.add_argument('--execute-limit', type= int, default= 2000, help= 'Number of plans executed')
+	parser.add_argument('--calls', type= int, default= 1_000_000, help= 'Number of calls timed for override and initUT')
+	parser.add_argument('--repeat', type= int, default= 3)
+	parser.add_argument('--output', help= 'JSON file to write, stdout if missing')
+	parser.add_argument('--compare', help= 'JSON file written by a previous run to compare with')
+	args = parser.parse_args()
+
+	plans = bench_plans.run(args.depth, args.width, args.fan_out, args.algorithm, args.execute_limit, args.repeat)
+	results = {
+		'commit'    : _getCommit(),
+		'python'    : platform.python_version(),
+		'platform'  : platform.platform(),
+		'graph'     : plans['graph'],
+		'plans'     : plans['seconds'],
+		'override'  : bench_override.run(args.calls),
+	}
+
+	if args.compare is not None:
+		with open(args.compare) as file:
+			compare(json.load(file), results)
+
+	if args.output is not None:
+		with open(args.output, 'w') as file:
+			json.dump(results, file, indent= 4)
+	else:
+		print(json.dumps(results, indent= 4))
+
+
+if __name__ == '__main__':
+	main()
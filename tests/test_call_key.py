@@ -0,0 +1,26 @@
+import os, subprocess, sys
+
+from unit_test_advanced.UnitTest import UnitTest
+
+
+_KEY_SCRIPT = '''
+from unit_test_advanced.UnitTest import UnitTest
+print(UnitTest(is_enabled= True)._getCallKey('getUsers', ({'alice', 'bob', 'carol'},), {'filters': {'role': 'admin', 'tags': frozenset({'x', 'y'})}}))
+'''
+
+
+def test_call_key_is_the_same_in_every_process():
+	keys = set()
+	for seed in ('1', '2', '3'):
+		environment = {**os.environ, 'PYTHONHASHSEED': seed, 'PYTHONPATH': os.path.dirname(os.path.dirname(os.path.abspath(__file__)))}
+		keys.add(subprocess.run([sys.executable, '-c', _KEY_SCRIPT], env= environment, capture_output= True, text= True, check= True).stdout)
+		
+	assert len(keys) == 1
+
+
+def test_call_key_ignores_the_insertion_order_of_dicts():
+	UT = UnitTest(is_enabled= True)
+	
+	assert UT._getCallKey('getUsers', ({'a': 1, 'b': [2, {'c', 'd'}]},), {}) == UT._getCallKey('getUsers', ({'b': [2, {'d', 'c'}], 'a': 1},), {})
+	assert UT._getCallKey('getUsers', ({'a': 1},), {}) != UT._getCallKey('getUsers', ({'a': 2},), {})
+	assert UT._getCallKey('getUsers', ([1, 2],), {}) != UT._getCallKey('getUsers', ((1, 2),), {})
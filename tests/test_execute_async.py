@@ -0,0 +1,38 @@
+import asyncio, json, sys, textwrap
+
+import pytest
+
+from unit_test_advanced.UnitTest import UnitTest
+
+
+def test_plans_cancelled_by_fail_fast_are_not_recorded(tmp_path, monkeypatch):
+	monkeypatch.syspath_prepend(str(tmp_path))
+	(tmp_path / 'async_acts.py').write_text(textwrap.dedent('''
+		import asyncio
+
+		async def fail(UT):
+			await asyncio.sleep(0.01)
+			raise Exception('Failing plan')
+
+		async def wait(UT):
+			await asyncio.sleep(5)
+
+		class Failing:
+			trigger = fail
+
+		class Waiting:
+			trigger = wait
+	'''))
+	sys.modules.pop('async_acts', None)
+	run_history  = tmp_path / 'history.json'
+	result_cache = tmp_path / 'results.json'
+	
+	UT = UnitTest(is_enabled= True, run_history= str(run_history), result_cache= str(result_cache))
+	with pytest.raises(Exception, match= 'Failing plan'):
+		asyncio.run(UT.executeAsync([['async_acts.Failing'], ['async_acts.Waiting']], concurrency= 2))
+		
+	assert [plan['status'] for plan in UT.getReport().plans] == ['failed']
+	assert [entry['status'] for entry in json.loads(run_history.read_text())['plans'].values()] == ['failed']
+	assert json.loads(result_cache.read_text())['plans'] == {}
+	
+	sys.modules.pop('async_acts', None)
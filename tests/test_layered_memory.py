@@ -0,0 +1,67 @@
+import pytest
+
+from unit_test_advanced.LayeredMemory import LayeredMemory
+
+
+class stepParent:
+	pass
+
+
+class stepChild:
+	pass
+
+
+def test_delete_over_parent_hides_the_key_without_touching_the_parent():
+	parent  = LayeredMemory({'token': 'abc', 'user': 1}, owner= stepParent)
+	child   = parent.push(stepChild)
+	
+	del child['token']
+	
+	assert 'token' not in child
+	assert child == {'user': 1}
+	assert len(child) == 1
+	assert parent == {'token': 'abc', 'user': 1}
+	with pytest.raises(KeyError):
+		child['token']
+	with pytest.raises(KeyError):
+		del child['token']
+
+
+def test_set_after_delete_makes_the_key_visible_again():
+	parent  = LayeredMemory({'token': 'abc'}, owner= stepParent)
+	child   = parent.push(stepChild)
+	
+	del child['token']
+	child['token'] = 'xyz'
+	
+	assert child['token'] == 'xyz'
+	assert child.toDict() == {'token': 'xyz'}
+	assert parent['token'] == 'abc'
+	
+	del child['token']
+	assert 'token' not in child
+
+
+def test_delete_of_a_key_only_in_the_top_layer():
+	child = LayeredMemory(owner= stepParent).push(stepChild)
+	child['token'] = 'abc'
+	
+	del child['token']
+	
+	assert child == {}
+	assert child._layer == {}
+
+
+def test_who_wrote_follows_the_layers():
+	parent  = LayeredMemory({'token': 'abc', 'user': 1}, owner= stepParent)
+	child   = parent.push(stepChild)
+	child['user'] = 2
+	
+	assert child.whoWrote('token') is stepParent
+	assert child.whoWrote('user') is stepChild
+	assert parent.whoWrote('user') is stepParent
+	assert child.whoWrote('missing') is None
+	
+	del child['token']
+	assert child.whoWrote('token') is None
+	assert child.getWriters() == {'user': stepChild}
@@ -0,0 +1,40 @@
+from unit_test_advanced.OverrideCache import OverrideCache
+
+
+def test_least_recently_used_result_is_evicted():
+	cache = OverrideCache(max_size= 2)
+	cache.set(('getUser', 'a'), 1)
+	cache.set(('getUser', 'b'), 2)
+	
+	# Reading "a" makes "b" the least recently used one
+	assert cache.get(('getUser', 'a')) == (True, 1)
+	cache.set(('getUser', 'c'), 3)
+	
+	assert cache.get(('getUser', 'b')) == (False, None)
+	assert cache.get(('getUser', 'a')) == (True, 1)
+	assert cache.get(('getUser', 'c')) == (True, 3)
+	assert cache.getStats() == {'hits': 3, 'misses': 1, 'evictions': 1}
+
+
+def test_set_of_an_existing_key_does_not_evict():
+	cache = OverrideCache(max_size= 2)
+	cache.set(('getUser', 'a'), 1)
+	cache.set(('getUser', 'b'), 2)
+	cache.set(('getUser', 'a'), 3)
+	
+	assert cache.get(('getUser', 'a')) == (True, 3)
+	assert cache.get(('getUser', 'b')) == (True, 2)
+	assert cache.getStats()['evictions'] == 0
+
+
+def test_no_limit_and_clear_by_id():
+	cache = OverrideCache(max_size= None)
+	for idx in range(500):
+		cache.set(('getUser', idx), idx)
+	cache.set(('getOrder', 0), 'order')
+	
+	cache.clear('getUser')
+	
+	assert cache.get(('getUser', 0)) == (False, None)
+	assert cache.get(('getOrder', 0)) == (True, 'order')
+	assert cache.getStats() == {'hits': 1, 'misses': 1, 'evictions': 0}
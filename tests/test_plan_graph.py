@@ -0,0 +1,80 @@
+import pytest
+
+from benchmarks.graphs import makeGraph
+from unit_test_advanced.UnitTest import UnitTest
+
+
+SIDE_PLANS = [('all', 'all'), ('main', 'main'), ('edges', 'edges'), ('all', 'edges'), ('main', 'all')]
+
+
+def _fingerprints(UT, plans):
+	return [UT.getPlanFingerprint(plan) for plan in plans]
+
+
+def _reachableRelations(root):
+	'''
+		Pairs (dependency, test-class) and (test-class, child) reachable from root, on each side
+	'''
+	
+	UT          = UnitTest(is_enabled= True)
+	relations   = set()
+	for attr in ('dependencies', 'children'):
+		todo, seen = [root], {root}
+		while len(todo) > 0:
+			module = todo.pop()
+			for path in getattr(module, attr):
+				related = UT._importModule(path)
+				relations.add((related, module) if attr == 'dependencies' else (module, related))
+				if related not in seen:
+					seen.add(related)
+					todo.append(related)
+					
+	return relations
+
+
+@pytest.mark.parametrize('parent_execution_plan, children_execution_plan', SIDE_PLANS)
+def test_estimate_equals_the_plans_built(parent_execution_plan, children_execution_plan):
+	levels = makeGraph(depth= 5, width= 4, fan_out= 2, seed= 1)
+	for root in (levels[0][0], levels[2][0], levels[4][3]):
+		UT          = UnitTest(is_enabled= True, parent_execution_plan= parent_execution_plan, children_execution_plan= children_execution_plan)
+		estimate    = UT.estimatePlans([root])
+		UT.preparePlans([root])
+		plans       = UT.getExecutionPlans()
+		
+		assert estimate == {'plans': len(plans), 'actions': sum(len(plan) for plan in plans)}
+
+
+@pytest.mark.parametrize('parent_execution_plan, children_execution_plan', SIDE_PLANS)
+def test_iter_plans_matches_prepare_plans(parent_execution_plan, children_execution_plan):
+	levels          = makeGraph(depth= 5, width= 4, fan_out= 2, seed= 2)
+	list_unit_tests = [levels[1][0], levels[2][1], [levels[0][0], levels[1][0]], levels[3][2]]
+	
+	UT = UnitTest(is_enabled= True, parent_execution_plan= parent_execution_plan, children_execution_plan= children_execution_plan)
+	UT.preparePlans(list_unit_tests)
+	prepared = _fingerprints(UT, UT.getExecutionPlans())
+	
+	UT = UnitTest(is_enabled= True, parent_execution_plan= parent_execution_plan, children_execution_plan= children_execution_plan)
+	assert _fingerprints(UT, UT.iterPlans(list_unit_tests)) == prepared
+
+
+def test_edges_cover_every_reachable_relation():
+	levels = makeGraph(depth= 6, width= 5, fan_out= 3, seed= 3)
+	for root in (levels[0][0], levels[3][2], levels[5][4]):
+		UT = UnitTest(is_enabled= True, parent_execution_plan= 'edges', children_execution_plan= 'edges')
+		UT.preparePlans([root])
+		covered = {(plan[idx], plan[idx + 1]) for plan in UT.getExecutionPlans() for idx in range(len(plan) - 1)}
+		
+		assert _reachableRelations(root) <= covered
+
+
+def test_sampled_plans_are_distinct():
+	levels  = makeGraph(depth= 6, width= 5, fan_out= 3, seed= 4)
+	root    = levels[3][0]
+	total   = UnitTest(is_enabled= True).estimatePlans([root])['plans']
+	for sample_plans in (1, 10, total, total + 5):
+		UT = UnitTest(is_enabled= True, sample_plans= sample_plans, random_seed= 5)
+		UT.preparePlans([root])
+		fingerprints = _fingerprints(UT, UT.getExecutionPlans())
+		
+		assert len(fingerprints) == min(sample_plans, total)
+		assert len(set(fingerprints)) == len(fingerprints)
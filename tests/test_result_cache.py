@@ -0,0 +1,102 @@
+import sys, textwrap
+
+import pytest
+
+from unit_test_advanced.UnitTest import UnitTest
+
+
+def _writeModules(directory, value):
+	'''
+		Production function decorated with initUT returning "value", and a test-class expecting it to return 1
+	'''
+	
+	(directory / 'cache_prod.py').write_text(textwrap.dedent(f'''
+		from unit_test_advanced.functools import initUT
+
+		@initUT
+		def run(UT):
+			return {value}
+	'''))
+	(directory / 'cache_acts.py').write_text(textwrap.dedent('''
+		import cache_prod
+
+		class Act:
+			trigger = cache_prod.run
+
+			def finalCheck(self):
+				if cache_prod.run() != 1:
+					raise Exception('Unexpected result')
+	'''))
+	for name in ('cache_prod', 'cache_acts'):
+		sys.modules.pop(name, None)
+
+
+def test_decorated_trigger_change_runs_the_plan_again(tmp_path, monkeypatch):
+	monkeypatch.syspath_prepend(str(tmp_path))
+	# Same size and possibly same mtime once edited: no stale bytecode
+	monkeypatch.setattr(sys, 'dont_write_bytecode', True)
+	result_cache = str(tmp_path / 'results.json')
+	
+	_writeModules(tmp_path, 1)
+	report = UnitTest(is_enabled= True, result_cache= result_cache).execute([['cache_acts.Act']])
+	assert [plan['status'] for plan in report.plans] == ['passed']
+	
+	_writeModules(tmp_path, 2)
+	UT = UnitTest(is_enabled= True, result_cache= result_cache)
+	with pytest.raises(Exception, match= 'Unexpected result'):
+		UT.execute([['cache_acts.Act']])
+		
+	assert [plan['status'] for plan in UT.getReport().plans] == ['failed']
+	
+	for name in ('cache_prod', 'cache_acts'):
+		sys.modules.pop(name, None)
+
+
+def _writeBaseModules(directory, expected):
+	'''
+		Base class checking the result of the production function against "expected", and a test-class inheriting from it
+	'''
+	
+	(directory / 'cache_base_prod.py').write_text(textwrap.dedent('''
+		def run(UT):
+			return 1
+	'''))
+	(directory / 'cache_base.py').write_text(textwrap.dedent(f'''
+		import cache_base_prod
+
+		class BaseAct:
+			def finalCheck(self):
+				if cache_base_prod.run(None) != {expected}:
+					raise Exception('Unexpected result')
+	'''))
+	(directory / 'cache_base_acts.py').write_text(textwrap.dedent('''
+		import cache_base, cache_base_prod
+
+		class Act(cache_base.BaseAct):
+			trigger = cache_base_prod.run
+	'''))
+	for name in ('cache_base_prod', 'cache_base', 'cache_base_acts'):
+		sys.modules.pop(name, None)
+
+
+def test_base_class_change_runs_the_plan_again(tmp_path, monkeypatch):
+	monkeypatch.syspath_prepend(str(tmp_path))
+	monkeypatch.setattr(sys, 'dont_write_bytecode', True)
+	result_cache = str(tmp_path / 'results.json')
+	
+	_writeBaseModules(tmp_path, 1)
+	report = UnitTest(is_enabled= True, result_cache= result_cache).execute([['cache_base_acts.Act']])
+	assert [plan['status'] for plan in report.plans] == ['passed']
+	
+	report = UnitTest(is_enabled= True, result_cache= result_cache).execute([['cache_base_acts.Act']])
+	assert [plan['status'] for plan in report.plans] == ['cached']
+	
+	_writeBaseModules(tmp_path, 2)
+	UT = UnitTest(is_enabled= True, result_cache= result_cache)
+	with pytest.raises(Exception, match= 'Unexpected result'):
+		UT.execute([['cache_base_acts.Act']])
+		
+	assert [plan['status'] for plan in UT.getReport().plans] == ['failed']
+	
+	for name in ('cache_base_prod', 'cache_base', 'cache_base_acts'):
+		sys.modules.pop(name, None)
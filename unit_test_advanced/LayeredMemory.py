@@ -0,0 +1,138 @@
+from collections.abc import Mapping, MutableMapping
+
+# Marks, in a layer, a key deleted from the layers below
+_DELETED = object()
+
+
+class LayeredMemory(MutableMapping):
+	'''
+		Memory of an execution plan: one layer per test-class, stacked on the layers of the previous test-classes.
+		The layers below are shared, never copied: writing only touches the top layer, reading falls back to the layers below.
+		Once a test-class is executed, its memory is a snapshot of the plan at this step
+	'''
+	
+	def __init__(self, values = None, owner = None, parent = None):
+		'''
+			values: Initial values of the top layer
+			owner: Test-class writing in the top layer
+			parent: Layers below
+		'''
+		
+		self._layer     = {}
+		self._owner     = owner
+		self._parent    = parent
+		
+		if values is not None:
+			self.update(values)
+	
+	def push(self, owner):
+		'''
+			New layer for "owner" on top of this memory
+		'''
+		
+		return LayeredMemory(owner= owner, parent= self)
+	
+	def _find(self, key):
+		'''
+			Layer (LayeredMemory) holding the key, None if not found or deleted
+		'''
+		
+		memory = self
+		while memory is not None:
+			if key in memory._layer:
+				if memory._layer[key] is _DELETED:
+					return None
+				return memory
+			memory = memory._parent
+		
+		return None
+	
+	def _flatten(self):
+		'''
+			All the values visible from the top layer, in the order they were first written
+		'''
+		
+		layers = []
+		memory = self
+		while memory is not None:
+			layers.append(memory._layer)
+			memory = memory._parent
+		
+		values = {}
+		for layer in reversed(layers):
+			for key, value in layer.items():
+				if value is _DELETED:
+					values.pop(key, None)
+				else:
+					values[key] = value
+		
+		return values
+	
+	def __getitem__(self, key):
+		memory = self._find(key)
+		if memory is None:
+			raise KeyError(key)
+		
+		return memory._layer[key]
+	
+	def __setitem__(self, key, value):
+		self._layer[key] = value
+	
+	def __delitem__(self, key):
+		if self._find(key) is None:
+			raise KeyError(key)
+		
+		if self._parent is not None and self._parent._find(key) is not None:
+			self._layer[key] = _DELETED
+		else:
+			del self._layer[key]
+	
+	def __contains__(self, key):
+		return self._find(key) is not None
+	
+	def __iter__(self):
+		return iter(self._flatten())
+	
+	def __len__(self):
+		return len(self._flatten())
+	
+	def __repr__(self):
+		return f'LayeredMemory({self._flatten()})'
+	
+	def __eq__(self, other):
+		if isinstance(other, Mapping):
+			return self._flatten() == dict(other)
+		
+		return NotImplemented
+	
+	def toDict(self):
+		'''
+			Plain dict of all the values visible from the top layer (json.dumps, isinstance(..., dict)...). Not updated afterwards
+		'''
+		
+		return self._flatten()
+	
+	def copy(self):
+		'''
+			Same as dict.copy: a shallow copy, as a plain dict
+		'''
+		
+		return self._flatten()
+	
+	def whoWrote(self, key):
+		'''
+			Test-class which wrote the current value of the key, None if the key is not in memory
+		'''
+		
+		memory = self._find(key)
+		if memory is None:
+			return None
+		
+		return memory._owner
+	
+	def getWriters(self):
+		'''
+			Test-class which wrote the current value of each key
+		'''
+		
+		return {key: self.whoWrote(key) for key in self._flatten()}
@@ -0,0 +1,89 @@
+import logging, logging.handlers, sys
+
+# Root of the loggers below: where the handlers are set
+logger          = logging.getLogger('unit_test_advanced')
+
+# Progress of the execution, in verbose mode
+progress_logger = logging.getLogger('unit_test_advanced.progress')
+
+# Messages of the test-classes and of the production code (UnitTest.log)
+log_logger      = logging.getLogger('unit_test_advanced.log')
+
+# Summaries of the executions, failures and random seeds
+summary_logger  = logging.getLogger('unit_test_advanced.summary')
+
+# Number of records kept in the buffer before being written, unless a plan ends first
+BUFFER_CAPACITY = 1000
+
+# True once "installDefaultHandler" checked the handlers
+_installed      = False
+
+
+class Message:
+	'''
+		Message made of the arguments passed to "print", only joined when a handler writes it
+	'''
+	
+	__slots__ = ('args', 'level')
+	
+	def __init__(self, args, level = 0):
+		self.args   = args
+		self.level  = level
+	
+	def __str__(self):
+		args = self.args
+		if 1 <= self.level <= 4:
+			args = (f'{"":{4 * self.level}}', *args)
+		
+		return ' '.join(str(arg) for arg in args)
+
+
+class _StdoutHandler(logging.StreamHandler):
+	'''
+		Writing to the current sys.stdout, like print, even when it is replaced after the handler is created
+	'''
+	
+	def emit(self, record):
+		self.stream = sys.stdout
+		super().emit(record)
+
+
+def setHandler(handler, capacity = BUFFER_CAPACITY):
+	'''
+		Sending the output to "handler" (any logging.Handler), through a buffer flushed after each plan.
+		The messages still propagate to the handlers of the application (root logger) unless "logger.propagate" is set to False
+	'''
+	
+	for previous in list(logger.handlers):
+		logger.removeHandler(previous)
+		previous.close()
+	
+	logger.addHandler(logging.handlers.MemoryHandler(capacity, flushLevel= logging.ERROR, target= handler))
+	logger.setLevel(logging.INFO)
+
+
+def installDefaultHandler():
+	'''
+		Writing the output to stdout like print, unless handlers are already set on the "unit_test_advanced" logger or by the application (root logger).
+		Called when the first message is written, not when unit_test_advanced is imported: production code only importing initUT is left untouched
+	'''
+	
+	global _installed
+	if _installed == False:
+		_installed = True
+		if logger.level == logging.NOTSET:
+			logger.setLevel(logging.INFO)
+		
+		if logger.hasHandlers() == False:
+			handler = _StdoutHandler()
+			handler.setFormatter(logging.Formatter('%(message)s'))
+			setHandler(handler)
+
+
+def flush():
+	'''
+		Writing the buffered output
+	'''
+	
+	for handler in logger.handlers:
+		handler.flush()
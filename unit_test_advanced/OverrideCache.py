@@ -0,0 +1,58 @@
+from collections import OrderedDict
+from threading import Lock
+
+
+class OverrideCache:
+	'''
+		Results of the real functions called through "override", by (id, digest of the arguments).
+		Once "max_size" results are kept, the least recently used one is evicted. Safe to use from multiple threads
+	'''
+	
+	def __init__(self, max_size = 128):
+		'''
+			max_size: Maximum number of results kept, None for no limit
+		'''
+		
+		self._values    = OrderedDict()
+		self._max_size  = max_size
+		self._lock      = Lock()
+		self.hits       = 0
+		self.misses     = 0
+		self.evictions  = 0
+	
+	def get(self, key):
+		'''
+			Returns (True, result) when the result is cached, (False, None) otherwise
+		'''
+		
+		with self._lock:
+			if key in self._values:
+				self._values.move_to_end(key)
+				self.hits += 1
+				return True, self._values[key]
+			
+			self.misses += 1
+			return False, None
+	
+	def set(self, key, value):
+		with self._lock:
+			self._values[key] = value
+			self._values.move_to_end(key)
+			while self._max_size is not None and len(self._values) > self._max_size:
+				self._values.popitem(last= False)
+				self.evictions += 1
+	
+	def clear(self, id = None):
+		'''
+			Forgetting the results of an override id, or all of them
+		'''
+		
+		with self._lock:
+			if id is None:
+				self._values.clear()
+			else:
+				for key in [key for key in self._values if key[0] == id]:
+					del self._values[key]
+	
+	def getStats(self):
+		return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
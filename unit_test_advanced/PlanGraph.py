@@ -0,0 +1,269 @@
+class PlanGraph:
+	'''
+		Relationships ("dependencies" and "children") between the test-classes, compiled once into integer ids and adjacency lists.
+		A test-class is compiled when it is first reached: its relations are resolved the first time they are followed
+	'''
+	
+	def __init__(self, resolve, on_relation = None):
+		'''
+			resolve: Function returning the test-class from a test-class or its import path
+			on_relation: Function called once per compiled relation with (related test-class, reverse attribute, test-class)
+		'''
+		
+		self._resolve       = resolve
+		self._on_relation   = on_relation
+		self._ids           = {}
+		self._modules       = []
+		self._relations     = {'dependencies': [], 'children': []}
+		self._path_counts   = {}
+		self._edge_covers   = {}
+	
+	def getId(self, module):
+		'''
+			Integer id of a test-class, registered if not known yet
+		'''
+		
+		module = self._resolve(module)
+		if module not in self._ids:
+			self._ids[module] = len(self._modules)
+			self._modules.append(module)
+			for relations in self._relations.values():
+				relations.append(None)
+		
+		return self._ids[module]
+	
+	def getModule(self, id):
+		return self._modules[id]
+	
+	def getModules(self):
+		'''
+			Test-classes compiled so far
+		'''
+		
+		return list(self._modules)
+	
+	def getRelations(self, id, attr):
+		'''
+			Ids of the test-classes declared in "dependencies" or "children"
+		'''
+		
+		relations = self._relations[attr][id]
+		if relations is None:
+			module      = self._modules[id]
+			relations   = [self.getId(related) for related in getattr(module, attr, [])]
+			self._relations[attr][id] = relations
+			
+			if self._on_relation is not None:
+				reverse_attr = 'children' if attr == 'dependencies' else 'dependencies'
+				for related in relations:
+					self._on_relation(self._modules[related], reverse_attr, module)
+		
+		return relations
+	
+	def _getFollowedRelations(self, id, attr, execution_plan):
+		'''
+			Relations that can be followed according to the execution plan algorithm. All of them unless only the first one is
+		'''
+		
+		relations = self.getRelations(id, attr)
+		if execution_plan == 'main':
+			return relations[:1]
+		
+		return relations
+	
+	
+	
+	def _findCycle(self, root, attr, execution_plan, reached):
+		'''
+			Iterative depth-first search from root. Returns the id of a test-class on a cycle, None otherwise.
+			"reached" is filled with the ids of the test-classes reachable from root
+		'''
+		
+		in_progress = {root: True}
+		stack       = [(root, iter(self._getFollowedRelations(root, attr, execution_plan)))]
+		while len(stack) > 0:
+			id, relations = stack[-1]
+			related = next(relations, None)
+			if related is None:
+				in_progress[id] = False
+				stack.pop()
+				continue
+			
+			if in_progress.get(related) == True:
+				return related
+			
+			if related not in in_progress:
+				in_progress[related] = True
+				reached.add(related)
+				stack.append((related, iter(self._getFollowedRelations(related, attr, execution_plan))))
+		
+		return None
+	
+	def findLoop(self, root, parent_execution_plan, children_execution_plan, count_limit_identify_infinite_loop):
+		'''
+			Returns the id of a test-class that would be executed "count_limit_identify_infinite_loop" times in a plan built from root, None otherwise.
+			Linear in the size of the graph reachable from root; done before building any plan
+		'''
+		
+		if count_limit_identify_infinite_loop <= 1:
+			return root
+		
+		ancestors   = set()
+		descendants = set()
+		for attr, execution_plan, reached in (('dependencies', parent_execution_plan, ancestors), ('children', children_execution_plan, descendants)):
+			id = self._findCycle(root, attr, execution_plan, reached)
+			if id is not None:
+				return id
+		
+		# Without cycle, a test-class is executed at most once on each side of root
+		if count_limit_identify_infinite_loop <= 2:
+			for id in ancestors:
+				if id in descendants:
+					return id
+		
+		return None
+	
+	
+	
+	def iterPaths(self, root, attr, select):
+		'''
+			Depth-first, yields every path from root following "dependencies" or "children".
+			select: Function returning the relations to follow among the ids passed
+			The yielded list is updated in place: consume it before the next iteration
+		'''
+		
+		path        = [root]
+		relations   = select(self.getRelations(root, attr))
+		if len(relations) == 0:
+			yield path
+			return
+		
+		stack = [iter(relations)]
+		while len(stack) > 0:
+			related = next(stack[-1], None)
+			if related is None:
+				stack.pop()
+				path.pop()
+				continue
+			
+			path.append(related)
+			relations = select(self.getRelations(related, attr))
+			if len(relations) == 0:
+				yield path
+				path.pop()
+			else:
+				stack.append(iter(relations))
+	
+	
+	
+	def countPaths(self, root, attr, execution_plan):
+		'''
+			Number of paths from root and their total length (test-classes executed), computed without building them.
+			Dynamic programming over the compiled graph, which must not have any cycle reachable from root (see findLoop).
+			With "random", a single path is built: its length is the longest one possible
+		'''
+		
+		counts  = self._path_counts.setdefault((attr, execution_plan), {})
+		stack   = [root]
+		while len(stack) > 0:
+			id = stack[-1]
+			if id in counts:
+				stack.pop()
+				continue
+			
+			relations   = self._getFollowedRelations(id, attr, execution_plan)
+			missing     = [related for related in relations if related not in counts]
+			if len(missing) > 0:
+				stack.extend(missing)
+				continue
+			
+			stack.pop()
+			if len(relations) == 0:
+				counts[id] = (1, 1)
+			elif execution_plan == 'random':
+				counts[id] = (1, 1 + max(counts[related][1] for related in relations))
+			else:
+				count       = sum(counts[related][0] for related in relations)
+				counts[id]  = (count, count + sum(counts[related][1] for related in relations))
+				
+		return counts[root]
+	
+	def getPathAt(self, root, attr, execution_plan, index):
+		'''
+			Path at the position "index" in the depth-first order of "iterPaths", found from the number of paths of each relation.
+			Not available for "random"
+		'''
+		
+		self.countPaths(root, attr, execution_plan)
+		counts  = self._path_counts[(attr, execution_plan)]
+		id      = root
+		path    = [root]
+		while True:
+			relations = self._getFollowedRelations(id, attr, execution_plan)
+			if len(relations) == 0:
+				return path
+			
+			for related in relations:
+				if index < counts[related][0]:
+					id = related
+					break
+				index -= counts[related][0]
+				
+			path.append(id)
+	
+	
+	
+	def coverEdges(self, root, attr):
+		'''
+			Small set of paths from root going through every relation reachable from root at least once.
+			Greedy: the path covering the most relations not covered yet is picked until all of them are covered.
+			The graph reachable from root must not have any cycle (see findLoop)
+		'''
+		
+		if (root, attr) in self._edge_covers:
+			return self._edge_covers[(root, attr)]
+		
+		covered = set()
+		paths   = []
+		while True:
+			# Number of relations not covered yet on the best path from each test-class
+			gains   = {}
+			stack   = [root]
+			while len(stack) > 0:
+				id = stack[-1]
+				if id in gains:
+					stack.pop()
+					continue
+				
+				relations   = self.getRelations(id, attr)
+				missing     = [related for related in relations if related not in gains]
+				if len(missing) > 0:
+					stack.extend(missing)
+					continue
+				
+				stack.pop()
+				gains[id] = max([gains[related] + ((id, related) not in covered) for related in relations], default= 0)
+				
+			if gains[root] == 0 and len(paths) > 0:
+				break
+			
+			id      = root
+			path    = [root]
+			while gains[id] > 0:
+				relations = self.getRelations(id, attr)
+				related = max(relations, key= lambda related: gains[related] + ((id, related) not in covered))
+				covered.add((id, related))
+				id = related
+				path.append(id)
+			
+			# Completing the path up to a test-class without relation
+			relations = self.getRelations(id, attr)
+			while len(relations) > 0:
+				id = relations[0]
+				path.append(id)
+				relations = self.getRelations(id, attr)
+				
+			paths.append(path)
+			
+		self._edge_covers[(root, attr)] = paths
+		return paths
@@ -0,0 +1,59 @@
+from contextvars import ContextVar
+from unit_test_advanced.LayeredMemory import LayeredMemory
+
+
+class RunContext:
+	'''
+		State of the execution plan being run by a UnitTest: memory, test-class instance currently executed...
+		Stored in a context variable, so each thread or asyncio task running a plan has its own state
+	'''
+	
+	def __init__(self, owner):
+		self.owner          = owner
+		self.memory         = LayeredMemory()
+		self.pooltest       = None
+		self.script_counter = {}
+		self.log            = False
+		
+		# Timings not added to the RunReport yet
+		self.actions        = []
+		self.overrides      = {}
+		
+		# Results of the overrides cached for the current plan only (see "override_cache_scope")
+		self.override_cache = None
+		
+		# Override ids of the test-class being executed (see UnitTest._buildDispatchTable)
+		self.dispatch       = {}
+		self.dispatch_owner = None
+		self.direct_calls   = {}
+		self.cacheable      = frozenset()
+		self.fakes_called   = set()
+		self.real_called    = set()
+		self.fake_usage     = None
+	
+	def recordOverride(self, id, kind, duration):
+		'''
+			kind: "fake" when the method of the test-class was called, "replay" when the result was read from the cassette, "cache" when it was memoized, "real" otherwise
+		'''
+		
+		stats = self.overrides.get(id)
+		if stats is None:
+			stats = self.overrides[id] = {'fake': [0, 0.0], 'real': [0, 0.0], 'replay': [0, 0.0], 'cache': [0, 0.0]}
+			
+		stats[kind][0] += 1
+		stats[kind][1] += duration
+
+
+# RunContext of the plan currently executed in the thread or task
+current_run : ContextVar = ContextVar('unit_test_advanced_current_run', default= None)
+
+
+def runState(name):
+	'''
+		Attribute of UnitTest read from and written to the RunContext of the plan being executed
+	'''
+	
+	return property(
+		lambda self: getattr(self._getContext(), name),
+		lambda self, value: setattr(self._getContext(), name, value),
+	)
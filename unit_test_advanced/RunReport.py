@@ -0,0 +1,164 @@
+from threading import Lock
+
+
+class RunReport:
+	'''
+		Timings collected while executing the plans (monotonic clock, in seconds):
+		each phase of each test-class of each plan, each plan, and the calls to "override" (fake method or real function)
+	'''
+	
+	def __init__(self):
+		self.actions    = []
+		self.plans      = []
+		self.overrides  = {}
+		self.cache      = {'hits': 0, 'misses': 0, 'evictions': 0}
+		self._lock      = Lock()
+	
+	def __getstate__(self):
+		# Sent back from the worker processes: the lock cannot be pickled
+		return {key: value for key, value in self.__dict__.items() if key != '_lock'}
+	
+	def __setstate__(self, state):
+		self.__dict__.update(state)
+		self._lock = Lock()
+	
+	def add(self, actions = [], plans = [], overrides = {}):
+		'''
+			Adding the timings of one or multiple plans. Safe to call from multiple threads
+			actions: [{'plan': fingerprint, 'module': import path, 'instantiate': s, 'trigger': s, 'finalCheck': s, 'total': s}]
+			plans: [{'plan': fingerprint, 'duration': s, 'status': 'passed', 'failed' or 'cached' (skipped, see "result_cache"), 'error': str or None, 'traceback': str or None}]
+			overrides: {id: {'fake': [count, s], 'real': [count, s], 'replay': [count, s], 'cache': [count, s]}}
+		'''
+		
+		with self._lock:
+			self.actions += actions
+			self.plans   += plans
+			for id, kinds in overrides.items():
+				stats = self.overrides.setdefault(id, {'fake': [0, 0.0], 'real': [0, 0.0], 'replay': [0, 0.0], 'cache': [0, 0.0]})
+				for kind, (count, duration) in kinds.items():
+					stats[kind][0] += count
+					stats[kind][1] += duration
+	
+	def merge(self, report):
+		'''
+			Adding the timings of another report, from a worker process for instance
+		'''
+		
+		self.add(report.actions, report.plans, report.overrides)
+		self.addCacheStats(report.cache)
+	
+	def addCacheStats(self, stats):
+		'''
+			Hits, misses and evictions of an OverrideCache
+		'''
+		
+		with self._lock:
+			for stat in self.cache:
+				self.cache[stat] += stats[stat]
+	
+	
+	
+	def slowestActions(self, limit = 10):
+		'''
+			Test-classes sorted by cumulative time: [{'module', 'count', 'total', 'max', 'instantiate', 'trigger', 'finalCheck'}]
+		'''
+		
+		per_module = {}
+		for action in self.actions:
+			stats = per_module.setdefault(action['module'], {'module': action['module'], 'count': 0, 'total': 0.0, 'max': 0.0, 'instantiate': 0.0, 'trigger': 0.0, 'finalCheck': 0.0})
+			stats['count']  += 1
+			stats['total']  += action['total']
+			stats['max']     = max(stats['max'], action['total'])
+			for phase in ('instantiate', 'trigger', 'finalCheck'):
+				stats[phase] += action.get(phase, 0.0)
+		
+		return sorted(per_module.values(), key= lambda stats: stats['total'], reverse= True)[:limit]
+	
+	def slowestPlans(self, limit = 10):
+		'''
+			Plans sorted by duration
+		'''
+		
+		return sorted(self.plans, key= lambda plan: plan['duration'], reverse= True)[:limit]
+	
+	def expensiveOverrides(self, limit = 10):
+		'''
+			Override ids sorted by cumulative time: [{'id', 'fake_count', 'fake_time', 'real_count', 'real_time', 'replay_count', 'replay_time', 'cache_count', 'cache_time'}]
+		'''
+		
+		overrides = [{
+			'id'            : id,
+			'fake_count'    : stats['fake'][0],
+			'fake_time'     : stats['fake'][1],
+			'real_count'    : stats['real'][0],
+			'real_time'     : stats['real'][1],
+			'replay_count'  : stats['replay'][0],
+			'replay_time'   : stats['replay'][1],
+			'cache_count'   : stats['cache'][0],
+			'cache_time'    : stats['cache'][1],
+		} for id, stats in self.overrides.items()]
+		
+		return sorted(overrides, key= lambda stats: stats['fake_time'] + stats['real_time'] + stats['replay_time'] + stats['cache_time'], reverse= True)[:limit]
+	
+	def getDeadFakes(self):
+		'''
+			Fake methods declared by each test-class and never called through "override", in any of its executions
+		'''
+		
+		dead = {}
+		for action in self.actions:
+			if 'unused_fakes' in action:
+				unused = set(action['unused_fakes'])
+				dead[action['module']] = dead[action['module']] & unused if action['module'] in dead else unused
+				
+		return {module: sorted(names) for module, names in dead.items() if len(names) > 0}
+	
+	def getOverridesWithoutFake(self):
+		'''
+			Override ids called while each test-class was executed without any fake method for them
+		'''
+		
+		missing = {}
+		for action in self.actions:
+			if len(action.get('overrides_without_fake', [])) > 0:
+				missing.setdefault(action['module'], set()).update(action['overrides_without_fake'])
+				
+		return {module: sorted(ids) for module, ids in missing.items()}
+	
+	def getFailures(self):
+		return [plan for plan in self.plans if plan['status'] == 'failed']
+	
+	def summary(self, limit = 5):
+		'''
+			Text report of the slowest test-classes, plans and overrides
+		'''
+		
+		cached  = len([plan for plan in self.plans if plan['status'] == 'cached'])
+		lines   = [f'{len(self.plans)} execution plan(s), {len(self.getFailures())} failed, {cached} skipped (cached), {sum(plan["duration"] for plan in self.plans):.3f}s']
+		
+		lines.append('Slowest test-classes:')
+		for stats in self.slowestActions(limit):
+			lines.append(f'{"":4}{stats["total"]:.3f}s  x{stats["count"]:<5} {stats["module"]}  (instantiate {stats["instantiate"]:.3f}s, trigger {stats["trigger"]:.3f}s, finalCheck {stats["finalCheck"]:.3f}s)')
+		
+		lines.append('Slowest plans:')
+		for plan in self.slowestPlans(limit):
+			lines.append(f'{"":4}{plan["duration"]:.3f}s  {plan["status"]:6} {" > ".join(plan["plan"])}')
+		
+		# Only timed with the setting "time_overrides"
+		if len(self.overrides) > 0:
+			lines.append('Most expensive overrides:')
+			for stats in self.expensiveOverrides(limit):
+				lines.append(f'{"":4}{stats["fake_time"] + stats["real_time"] + stats["replay_time"] + stats["cache_time"]:.3f}s  {stats["id"]}  (fake x{stats["fake_count"]} {stats["fake_time"]:.3f}s, real x{stats["real_count"]} {stats["real_time"]:.3f}s, replay x{stats["replay_count"]} {stats["replay_time"]:.3f}s, cache x{stats["cache_count"]} {stats["cache_time"]:.3f}s)')
+		
+		for module, names in self.getDeadFakes().items():
+			lines.append(f'Fake methods never called in {module}: {", ".join(names)}')
+		for module, ids in self.getOverridesWithoutFake().items():
+			lines.append(f'Overrides without fake in {module}: {", ".join(ids)}')
+			
+		if self.cache['hits'] + self.cache['misses'] > 0:
+			lines.append(f'Override cache: {self.cache["hits"]} hit(s), {self.cache["misses"]} miss(es), {self.cache["evictions"]} eviction(s)')
+		
+		return '\n'.join(lines)
+	
+	def __str__(self):
+		return self.summary()
@@ -9,25 +9,116 @@
 '''
 
 from importlib import import_module as sys_import_module
-import random
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from hashlib import sha1
+from threading import Lock
+from time import perf_counter
+import asyncio, cProfile, importlib.util, inspect, json, os, pickle, random, re, sys, time, traceback, tracemalloc, types
+
+from unit_test_advanced import Output
+from unit_test_advanced.LayeredMemory import LayeredMemory
+from unit_test_advanced.OverrideCache import OverrideCache
+from unit_test_advanced.PlanGraph import PlanGraph
+from unit_test_advanced.RunContext import RunContext, current_run, runState
+from unit_test_advanced.RunReport import RunReport
+
+
+# Methods of the test-classes called by UnitTest itself, never fakes
+_LIFECYCLE_METHODS = {'trigger', 'finalCheck', 'snapshotState', 'restoreState'}
+
+# Override id not looked up on the test-class yet
+_UNRESOLVED = object()
+
+# Version of the files written by "exportPlans", older files are rebuilt
+_PLAN_SET_VERSION = 1
+
+# Settings changing the plans built by "preparePlans", part of the graph hash of the exported plan sets
+_PLAN_SET_SETTINGS = ('parent_execution_plan', 'children_execution_plan', 'count_limit_identify_infinite_loop', 'max_execution_plans', 'max_execution_plans_policy', 'sample_plans', 'random_seed')
+
+
+def _initWorker(sys_path):
+	'''
+		Making the modules importable by the parent process importable by the worker processes as well
+	'''
+	
+	for path in sys_path:
+		if path not in sys.path:
+			sys.path.append(path)
+
+
+def _runPlansInWorker(settings, execution_plans, share_prefixes, fail_fast):
+	'''
+		Executing, in a worker process, execution plans made of import paths.
+		Failures are returned to the parent process instead of being raised
+	'''
+	
+	UT      = UnitTest(**settings)
+	result  = UT._runPlansCollectingFailure([list(execution_plan) for execution_plan in execution_plans], share_prefixes, fail_fast)
+	UT._closeOverrideCache()
+	return {**result, 'report': UT.getReport(), 'recorded_calls': UT._recorded_calls}
+
 
 class UnitTest:
 	
-	_memory                  : dict = {}
-	_execution_plans         : list = []
-	_loaded_plans            : list = []
+	# State of the plan being run, isolated per thread and asyncio task (see RunContext)
+	_memory                  = runState('memory')
+	_script_counter          = runState('script_counter')
+	_pooltest                = runState('pooltest')
+	_log                     = runState('log')
+	_default_context         : RunContext
+	_active_contexts         : tuple
+	
+	_execution_plans         : list
+	_loaded_plans            : set
+	_prepared_roots          : list
+	_graph                   : PlanGraph
+	_report                  : RunReport
 	
 	_verbose                 : bool
-	_log                     : bool
+	_quiet                   : bool = False
 	_is_enabled              : bool
 	_parent_execution_plan   : str
 	_children_execution_plan : str
-	_script_counter          : dict  = {}
-	_pooltest                        = None
 	
 	_count_limit_identify_infinite_loop : int
 	
-	def __init__(self, is_enabled = False, parent_execution_plan = 'all', children_execution_plan = 'all', count_limit_identify_infinite_loop = 2, verbose = False):
+	_max_execution_plans        : int = None
+	_max_execution_plans_policy : str = 'raise'
+	_sample_plans               : int = None
+	_random_seed                : int = None
+	_random                     : random.Random = None
+	
+	_profile                    : str = None
+	_profile_dir                : str = 'profiles'
+	_profile_actions            : list = None
+	
+	_result_cache               : str = None
+	_cached_results             : dict = None
+	_source_hashes              : dict
+	
+	_run_history                : str = None
+	_history                    : dict = None
+	
+	_cassette                   : str = None
+	_cassette_mode              : str = None
+	_cassette_miss              : str = 'fail'
+	_cassette_calls             : dict = None
+	_recorded_calls             : dict
+	
+	_cacheable_overrides        : list = None
+	_override_cache_size        : int = 128
+	_override_cache_scope       : str = 'run'
+	_time_overrides             : bool = False
+	_plain_override             : bool = True
+	_direct_calls               : dict = None
+	_override_cache             : OverrideCache
+	_fake_names                 : dict
+	_imported_modules           : dict
+	
+	_updatable_settings      : list = ['verbose', 'quiet', 'is_enabled', 'parent_execution_plan', 'children_execution_plan', 'count_limit_identify_infinite_loop', 'max_execution_plans', 'max_execution_plans_policy', 'sample_plans', 'random_seed', 'profile', 'profile_dir', 'profile_actions', 'result_cache', 'run_history', 'cassette', 'cassette_mode', 'cassette_miss', 'cacheable_overrides', 'override_cache_size', 'override_cache_scope', 'time_overrides']
+	
+	def __init__(self, is_enabled = False, parent_execution_plan = 'all', children_execution_plan = 'all', count_limit_identify_infinite_loop = 2, verbose = False, **kwargs):
 		'''
 			is_enabled: If true, UnitTesting is activated, otherwise will execute the default function in all cases
 			
@@ -35,13 +126,68 @@ class UnitTest:
 				"all"       executes all paths possible
 				"random"    executes ONE random path based on all the potential possibilities
 				"main"      executes the first path of all tests
+				"edges"     executes the fewest paths going through every relation at least once
 			
 			count_limit_identify_infinite_loop: Count to prevent looping multiple time on the same class. If set to 2, one class in an execution plan cannot be executed more than twice
 			
 			verbose: display progress of the execution
+			
+			Output: written through the "unit_test_advanced" loggers (see Output.py), to stdout by default, buffered and flushed after each plan
+			        (after each test-class and each "log" in verbose mode)
+			
+			quiet: Only display the summaries and the failures: neither the progress nor the messages of "log"
+			
+			Other settings (see "updateSettings"):
+			
+			max_execution_plans: Maximum number of plans "preparePlans" can build, estimated before building them. None for no limit
+			max_execution_plans_policy: When the estimate is above "max_execution_plans"
+				"raise"         raises an error without building any plan
+				"downsample"    builds evenly spread plans, each test-class passed getting a share of "max_execution_plans" proportional to its estimate.
+				                The plans passed as lists are kept, their number is taken from the limit first
+			
+			sample_plans: Number of distinct plans drawn uniformly among all the plans of each test-class passed, without building the others. None to build them all
+			random_seed: Seed of the "random" algorithm and of "sample_plans". None to draw one, displayed when used
+			
+			profile: Profiling each test-class executed (instantiate, trigger and finalCheck)
+				None        no profiling
+				"cpu"       cProfile, one ".pstats" file per test-class and plan
+				"memory"    tracemalloc, one ".tracemalloc" snapshot per test-class and plan
+				"all"       both
+			profile_dir: Directory where the profiles are written
+			profile_actions: Test-classes (or import paths) to profile. None to profile all of them
+			
+			result_cache: JSON file keeping the plans which passed, with a hash of the source of their test-classes and of the modules of their triggers.
+			              "execute" skips them until one of these sources changes. None to run all the plans
+			
+			run_history: JSON file keeping the last duration and outcome of each plan. When set, "execute" runs the plans which failed last time first,
+			             then the plans never run, then the longest ones first. None to run the plans in the order they are prepared
+			
+			cassette: Pickle file where the calls to the real functions of "override" are recorded
+			cassette_mode:
+				None        the real functions are called
+				"record"    the real functions are called, their arguments and result (or exception) are recorded in "cassette"
+				"replay"    the result recorded for the same id and arguments is returned without calling the real function
+			cassette_miss: In "replay" mode, when no call was recorded: "fail" raises an error, "record" calls the real function and records it
+			
+			cacheable_overrides: Override ids whose real function is memoized by id and arguments. Test-classes can also declare their own in "cacheable_overrides"
+			override_cache_size: Maximum number of results memoized, the least recently used ones being evicted. None for no limit
+			override_cache_scope: "run" to keep the results for the whole execution (per process), "plan" to forget them after each plan
+			
+			time_overrides: Counting and timing the calls of "override" in the RunReport. Off by default: it doubles the cost of each call
 		'''
 		
+		self._default_context   = RunContext(self)
+		self._report            = RunReport()
+		self._recorded_calls    = {}
+		self._override_cache    = None
+		self._fake_names        = {}
+		self._imported_modules  = {}
+		self._active_contexts   = ()
+		self._contexts_lock     = Lock()
+		self.resetExecutionPlans()
+		
 		self.updateSettings(**{
+			**kwargs,
 			'verbose'                               : verbose,
 			'is_enabled'                            : is_enabled,
 			'parent_execution_plan'                 : parent_execution_plan,
@@ -57,66 +203,141 @@ class UnitTest:
 			Securing the settings to update to a define list. Multiple settings can be updated at once
 		'''
 		
-		updatable_settings = ['verbose', 'is_enabled', 'parent_execution_plan', 'children_execution_plan', 'count_limit_identify_infinite_loop']
 		for kwarg, value in kwargs.items():
-			if kwarg in updatable_settings:
+			if kwarg in self._updatable_settings:
 				setattr(self, f'_{kwarg}', value)
+		
+		if 'random_seed' in kwargs:
+			self._random = None
+			
+		# Nothing to time, record or display around the calls of "override"
+		self._plain_override = self._time_overrides == False and self._verbose == False and self._cassette_mode is None
+		self._direct_calls   = None
 	
 	def log(self, *args, level = 0):
 		'''
-			Print out texts when unit test mode is enabled
+			Print out texts when unit test mode is enabled. The arguments are only formatted when written
 		'''
 		
-		if self._log == True:
-			args = list(args)
-			
-			if level == 1:
-				args.insert(0, f'{"":4}')
-			elif level == 2:
-				args.insert(0, f'{"":8}')
-			elif level == 3:
-				args.insert(0, f'{"":12}')
-			elif level == 4:
-				args.insert(0, f'{"":16}')
-				
-			print(*args)
+		if self._log == True and self._quiet == False:
+			Output.installDefaultHandler()
+			Output.log_logger.info('%s', Output.Message(args, level))
+			if self._verbose == True:
+				Output.flush()
 			
 	def _print(self, *args, level = 0):
 		'''
 			Print out texts when verbose mode is enabled
 		'''
 		
-		if self._verbose == True:
-			args = list(args)
-			
-			if level == 1:
-				args.insert(0, f'{"":4}')
-			elif level == 2:
-				args.insert(0, f'{"":8}')
-			elif level == 3:
-				args.insert(0, f'{"":12}')
-			elif level == 4:
-				args.insert(0, f'{"":16}')
-				
-			print(*args)
+		if self._verbose == True and self._quiet == False:
+			Output.installDefaultHandler()
+			Output.progress_logger.info('%s', Output.Message(args, level))
+	
+	def _printSummary(self, *args, level = 0):
+		'''
+			Print out the summaries and the failures in verbose and quiet modes
+		'''
+		
+		if self._verbose == True or self._quiet == True:
+			Output.installDefaultHandler()
+			Output.summary_logger.info('%s', Output.Message(args, level))
+	
 	
 	
+	def _getSettings(self):
+		'''
+			Current value of all the updatable settings
+		'''
+		
+		return {setting: getattr(self, f'_{setting}') for setting in self._updatable_settings}
+	
+	def _getImportPath(self, module):
+		'''
+			Reverse of "_importModule": string used to import the test-class from another process
+		'''
+		
+		if isinstance(module, str):
+			return module
+		
+		return f'{module.__module__}.{module.__qualname__}'
 	
 	def _importModule(self, module):
 		'''
-			Dynamically import modules if a string is passed
+			Dynamically import modules if a string is passed.
+			Each import path is resolved once per UnitTest, nested classes ("package.module.Outer.Inner") included
 		'''
 		if isinstance(module, str):
-			_tmp = module.split('.')
-			module_path = '.'.join(_tmp[:-1])
-			class_name  = _tmp[-1]
-			
-			# Importing the object dynamically
-			module = sys_import_module(module_path)
-			return getattr(module, class_name)
+			if module not in self._imported_modules:
+				self._imported_modules[module] = self._resolveImportPath(module)
+				
+			return self._imported_modules[module]
 		else:
 			return module
 	
+	def _resolveImportPath(self, path):
+		'''
+			Importing the longest module path of "path", then getting the (nested) class from it
+		'''
+		
+		_tmp = path.split('.')
+		for idx in range(len(_tmp) - 1, 0, -1):
+			module_path = '.'.join(_tmp[:idx])
+			try:
+				module = sys_import_module(module_path)
+			except ModuleNotFoundError as e:
+				# Only a missing module from the path itself means the class is nested deeper
+				if idx == 1 or (e.name != module_path and module_path.startswith(f'{e.name}.') == False):
+					raise
+				continue
+				
+			for class_name in _tmp[idx:]:
+				module = getattr(module, class_name)
+			return module
+		
+		raise Exception(f'Invalid import path "{path}": expected "module.ClassName"')
+	
+	
+	
+	def _getContext(self):
+		'''
+			RunContext of the plan executed by this UnitTest in the current thread or task, the default one when no plan is running.
+			Threads started by the production code do not inherit it: when a single plan is running, its RunContext is used.
+			When several plans are running, the plan cannot be guessed: an error is raised instead of calling the real functions
+		'''
+		
+		context = current_run.get()
+		if context is None or context.owner is not self:
+			active_contexts = self._active_contexts
+			if len(active_contexts) == 1:
+				return active_contexts[0]
+			
+			if len(active_contexts) > 1:
+				raise Exception(f'{len(active_contexts)} plans are running and this thread does not belong to any of them: start it with contextvars.copy_context().run (or asyncio.to_thread) from the trigger')
+				
+			return self._default_context
+		
+		return context
+	
+	@contextmanager
+	def _newRunContext(self):
+		'''
+			Running the plans of the block in a new RunContext, visible from the current thread or task only
+		'''
+		
+		context = RunContext(self)
+		token   = current_run.set(context)
+		with self._contexts_lock:
+			self._active_contexts   = (*self._active_contexts, context)
+			self._direct_calls      = None
+		try:
+			yield
+		finally:
+			current_run.reset(token)
+			with self._contexts_lock:
+				self._active_contexts   = tuple(active for active in self._active_contexts if active is not context)
+				self._direct_calls      = None
+	
 	
 	
 	def _resetCounter(self):
@@ -126,7 +347,7 @@ class UnitTest:
 		self._script_counter = {}
 		
 	def _resetMemory(self):
-		self._memory         = {}
+		self._memory         = LayeredMemory()
 	
 	
 	
@@ -137,293 +358,1734 @@ class UnitTest:
 			*args and **kwargs are the argument to pass to both the fake function and real function
 		'''
 		
-		if self._is_enabled == True and hasattr(self._pooltest, id):
-			self._print('Method overridden:', id, level= 1)
+		# Fast path for the tight loops of the production code: ids already called by the test-class being executed (see "_bindDirectCalls")
+		direct_calls = self._direct_calls
+		if direct_calls is not None:
+			fake = direct_calls.get(id)
+			if fake is False:
+				return function(*args, **kwargs)
+			if fake is not None:
+				return fake(*args, **kwargs)
+				
+		if self._is_enabled == True:
+			context         = self._getContext()
+			function, kind = self._selectOverride(context, id, function, args, kwargs)
+			if self._time_overrides == False:
+				return function(*args, **kwargs)
 			
-			return getattr(self._pooltest, id)(*args, **kwargs)
+			start = perf_counter()
+			try:
+				return function(*args, **kwargs)
+			finally:
+				context.recordOverride(id, kind, perf_counter() - start)
 		else:
 			return function(*args, **kwargs)
 	
 	
 	
-	def returnValue(self, value):
+	async def overrideAsync(self, id, function, *args, **kwargs):
 		'''
-			Simply return the passed values. Useful when just a value needs to be faked out during unit test
+			Same as "override" for coroutines: the fake method or the real function is awaited when it returns an awaitable
 		'''
 		
-		return value
+		if self._is_enabled == True:
+			context         = self._getContext()
+			function, kind  = self._selectOverride(context, id, function, args, kwargs)
+			if self._time_overrides == False:
+				result = function(*args, **kwargs)
+				if inspect.isawaitable(result):
+					result = await result
+				return result
+			
+			start = perf_counter()
+			try:
+				result = function(*args, **kwargs)
+				if inspect.isawaitable(result):
+					result = await result
+			finally:
+				context.recordOverride(id, kind, perf_counter() - start)
+		else:
+			result = function(*args, **kwargs)
+			if inspect.isawaitable(result):
+				result = await result
+			
+		return result
 	
-	def returnValues(self, *values):
+	def _selectOverride(self, context, id, function, args, kwargs):
 		'''
-			Simply return the passed value. Useful when just a value needs to be faked out during unit test
+			Fake method of the test-class being executed if it has one named "id", the real function otherwise.
+			The real function is replaced by the cassette according to "cassette_mode".
+			Returns the function to call and "fake", "replay" or "real"
 		'''
 		
-		return values
-	
+		if context.dispatch_owner is not context.pooltest:
+			self._buildDispatchTable(context)
+			
+		fake = context.dispatch.get(id, _UNRESOLVED)
+		if fake is _UNRESOLVED:
+			# Not a method of the test-class (attribute set on the instance...): looked up once
+			fake = context.dispatch[id] = getattr(context.pooltest, id, None)
+			
+		if fake is not None:
+			context.fakes_called.add(id)
+			context.direct_calls[id] = fake
+			if self._verbose == True:
+				self._print('Method overridden:', id, level= 1)
+			return fake, 'fake'
+		
+		context.real_called.add(id)
+		if id in context.cacheable:
+			return self._selectCachedCall(context, id, function, args, kwargs)
+		
+		context.direct_calls[id] = False
+		if self._cassette_mode is None:
+			return function, 'real'
+		
+		return self._selectRealCall(id, function, args, kwargs)
 	
-	def _checkInfiniteLoop(self, plans_list):
+	def _getFakeNames(self, module):
 		'''
-			Checks how many time a class is called and raise an error when the limit "count_limit_identify_infinite_loop" is reached
+			Methods declared by a test-class and its parents which can be called through "override"
 		'''
 		
-		for module_list in plans_list:
-			module_name_list = [module.__name__ for module in module_list]
-			module_over_the_limit = {module_name: True if module_name_list.count(module_name) >= self._count_limit_identify_infinite_loop else False for module_name in module_name_list}
-			for module_name, is_limit_reached in module_over_the_limit.items():
-				if is_limit_reached == True:
-					raise Exception(f'Possible infinite loop identified on {module_name}')
-	
-	
+		if module not in self._fake_names:
+			names = set()
+			for klass in module.__mro__[:-1]:
+				for name, value in vars(klass).items():
+					if name.startswith('_') == False and name not in _LIFECYCLE_METHODS and isinstance(value, (types.FunctionType, staticmethod, classmethod)):
+						names.add(name)
+			self._fake_names[module] = frozenset(names)
+			
+		return self._fake_names[module]
 	
-	def _run(self, module):
+	def _buildDispatchTable(self, context):
 		'''
-			Executing all the main functions of a class
-			pooltest        : Storing the current class executed for the unit test. Passing memory to access previous stored data
-			trigger_params  : Parameters (dict) to pass from the class to the triggered function
-			trigger         : Action (function) to trigger for the unit test
-			finalCheck     : Final check after the action is complete
+			Binding once the fake methods of the test-class being executed, so "override" only does a dict lookup
 		'''
 		
-		if self._is_enabled == True:
-			module = self._importModule(module)
-			
-			self._print('')
-			self._print('')
-			self._print('========= START:', module.__name__, '=========')
-			self._print('')
-			
-			init_params = {}
-			if hasattr(module, 'memory'):
-				init_params = {'memory': self._memory}
-
-			self._log = True
-			if hasattr(module, 'log') and module.log == False:
-				self._log = False
-				
-				
-			if hasattr(module, 'init_params'):
-				init_params = {**init_params, **module.init_params}
-			
-			self._pooltest = module(**init_params)
-			
-			
-			params = {}
-			if hasattr(self._pooltest, 'trigger_params'):
-				params = self._pooltest.trigger_params
-			
-			if hasattr(module, 'trigger'):
-				
-				module.trigger(**params, UT= self)
-			
-			if hasattr(self._pooltest, 'finalCheck'):
-				self._pooltest.finalCheck()
-				
-			# Updating the memory attribute
-			if hasattr(self._pooltest, 'memory'):
-				self._memory = self._pooltest.memory
-			
-			self._print('')
-			self._print('========= END:', module.__name__, '=========')
-			self._print('')
+		pooltest                = context.pooltest
+		context.dispatch        = {} if pooltest is None else {name: getattr(pooltest, name) for name in self._getFakeNames(type(pooltest))}
+		context.dispatch_owner  = pooltest
+		context.direct_calls    = {}
+		context.cacheable       = frozenset(self._cacheable_overrides or ()) | frozenset(getattr(pooltest, 'cacheable_overrides', ()))
+		context.fakes_called    = set()
+		context.real_called     = set()
 	
+	def _bindDirectCalls(self, context):
+		'''
+			When nothing is timed, recorded or displayed and a single plan is running, "override" reads the ids already called by the test-class
+			from an attribute of the instance: a fake method, or False for the real function. The first call of each id goes through "_selectOverride"
+		'''
+		
+		with self._contexts_lock:
+			if self._plain_override == True and self._active_contexts == (context,):
+				self._direct_calls = context.direct_calls
+			else:
+				self._direct_calls = None
 	
-	def _runExecutionPlan(self, execution_plan):
+	def _selectRealCall(self, id, function, args, kwargs):
 		'''
-			Running an execution plan
+			Real function, or the cassette according to "cassette_mode"
 		'''
 		
-		if self._is_enabled == True:
-			self._resetMemory()
-			self._print('Running execution plan: ', execution_plan)
-			for module in execution_plan:
-				self._run(module)
+		if self._cassette_mode is not None:
+			return self._selectCassetteCall(id, function, args, kwargs)
+		
+		return function, 'real'
 	
 	
 	
+	def _getOverrideCache(self, context):
+		'''
+			OverrideCache of the execution, or of the plan being run according to "override_cache_scope"
+		'''
+		
+		if self._override_cache_scope == 'plan':
+			if context.override_cache is None:
+				context.override_cache = OverrideCache(self._override_cache_size)
+			return context.override_cache
+		
+		if self._override_cache_scope != 'run':
+			raise Exception(f'Unknown override_cache_scope "{self._override_cache_scope}". Accepted values are "run" and "plan"')
+		
+		if self._override_cache is None:
+			self._override_cache = OverrideCache(self._override_cache_size)
+			
+		return self._override_cache
 	
-	def preparePlans(self, list_unit_tests = []):
+	def _selectCachedCall(self, context, id, function, args, kwargs):
 		'''
-			Preparing the plans according to the settings and list passed.
-			This function also prepare the execution tree for parents and children possibilities
+			Function returning the memoized result, or the real function wrapped to memoize its result. Exceptions are not memoized.
+			Results are memoized pickled, like in the cassette: each hit returns a new copy, so a plan changing it does not change it for the next plans.
+			Results which cannot be pickled are not memoized
 		'''
 		
-		if self._is_enabled == True:
-			for unit_test in list_unit_tests:
-				self._resetCounter()
-				if isinstance(unit_test, list):
-					self._execution_plans.append(unit_test)
-				else:
-					self._createExecutionPlans(unit_test)
-					
-			self._preventExecutionPlansDuplicates()
+		key = self._getCallKey(id, args, kwargs)
+		if key is None:
+			return self._selectRealCall(id, function, args, kwargs)
+		
+		cache           = self._getOverrideCache(context)
+		found, value    = cache.get(key)
+		if found == True:
+			return lambda *args, **kwargs: pickle.loads(value), 'cache'
+		
+		function, kind = self._selectRealCall(id, function, args, kwargs)
+		
+		def cacheCall(*args, **kwargs):
+			result = function(*args, **kwargs)
+			if inspect.isawaitable(result):
+				return self._cacheAwaitable(cache, key, result)
+			
+			self._cacheResult(cache, key, result)
+			return result
+		
+		return cacheCall, kind
 	
+	async def _cacheAwaitable(self, cache, key, awaitable):
+		result = await awaitable
+		self._cacheResult(cache, key, result)
+		return result
 	
+	def _cacheResult(self, cache, key, result):
+		try:
+			cache.set(key, pickle.dumps(result, protocol= 4))
+		except (pickle.PicklingError, TypeError, AttributeError):
+			pass
 	
-	def getExecutionPlans(self):
+	def clearOverrideCache(self, id = None):
 		'''
-			Return all the current execution plans
+			Forgetting the memoized results of an override id, or all of them, for the execution and for the plan being run
 		'''
 		
-		return self._execution_plans
+		for cache in (self._override_cache, self._getContext().override_cache):
+			if cache is not None:
+				cache.clear(id)
 	
+	def _closeOverrideCache(self, context = None):
+		'''
+			Adding the statistics of the OverrideCache of the execution, or of the plan run in "context", to the RunReport and dropping it
+		'''
+		
+		if context is None:
+			cache, self._override_cache = self._override_cache, None
+		else:
+			cache, context.override_cache = context.override_cache, None
+			
+		if cache is not None:
+			self._report.addCacheStats(cache.getStats())
 	
 	
-	def resetExecutionPlans(self):
+	
+	def _getCallKey(self, id, args, kwargs):
 		'''
-			Resetting the execution plan list
+			Key of a call in the cassette and in the override cache: the id and a digest of the pickled arguments, made canonical first
+			(see "_getCanonicalValue") so that equal arguments give the same key in every process. None when the arguments cannot be pickled
 		'''
 		
-		self._execution_plans    = []
-		self._loaded_plans       = []
+		try:
+			return (id, sha1(pickle.dumps(self._getCanonicalValue((args, kwargs)), protocol= 4)).hexdigest())
+		except (pickle.PicklingError, TypeError, AttributeError):
+			return None
 	
+	def _getCanonicalValue(self, value):
+		'''
+			Same value with the order of the dicts, sets and frozensets fixed, recursively through the lists and tuples.
+			A set pickles in hash order (random for strings from one process to another) and a dict in insertion order:
+			their items are sorted by their own pickle and a set is replaced by (set, sorted items).
+			Other objects are pickled as they are: their key is stable only if their pickle is
+		'''
+		
+		value_type = type(value)
+		if value_type is dict:
+			items = [(self._getCanonicalValue(key), self._getCanonicalValue(item)) for key, item in value.items()]
+			return dict(sorted(items, key= lambda item: pickle.dumps(item[0], protocol= 4)))
+		
+		if value_type is set or value_type is frozenset:
+			return (value_type, tuple(sorted((self._getCanonicalValue(item) for item in value), key= lambda item: pickle.dumps(item, protocol= 4))))
+		
+		if value_type is list or value_type is tuple:
+			return value_type(self._getCanonicalValue(item) for item in value)
+		
+		return value
 	
+	def _getCassetteCalls(self):
+		'''
+			Calls recorded in "cassette", loaded once per execution: {(id, digest of the arguments): pickled ('return' or 'raise', value)}
+		'''
+		
+		if self._cassette_calls is None:
+			calls = {}
+			if self._cassette is not None and os.path.exists(self._cassette) == True:
+				with open(self._cassette, 'rb') as file:
+					calls = pickle.load(file)['calls']
+			self._cassette_calls = calls
+			
+		return self._cassette_calls
 	
-	def execute(self, list_unit_tests = None):
+	def _selectCassetteCall(self, id, function, args, kwargs):
 		'''
-			Entry point to start the unit tests
-			Either prepare a list and execute or pass the list as argument to perform both actions at once
+			Function replaying the recorded call, or the real function wrapped to record its result
 		'''
 		
-		if self._is_enabled == True:
+		if self._cassette_mode not in ('record', 'replay'):
+			raise Exception(f'Unknown cassette_mode "{self._cassette_mode}". Accepted values are "record" and "replay"')
+		
+		key = self._getCallKey(id, args, kwargs)
+		if key is None:
+			self._print('Arguments cannot be pickled, real function called:', id, level= 1)
+			return function, 'real'
+		
+		if self._cassette_mode == 'replay':
+			recorded = self._recorded_calls.get(key, self._getCassetteCalls().get(key))
+			if recorded is not None:
+				self._print('Call replayed:', id, level= 1)
+				return lambda *args, **kwargs: self._replayCall(recorded), 'replay'
 			
-			if list_unit_tests != None:
-				self.preparePlans(list_unit_tests)
-				
-			for ep in self._execution_plans:
-				self._runExecutionPlan(ep)
-				
-			self.resetExecutionPlans()
+			if self._cassette_miss != 'record':
+				raise Exception(f'No call recorded in the cassette for "{id}" with these arguments: {args} {kwargs}')
 			
+		def recordCall(*args, **kwargs):
+			try:
+				result = function(*args, **kwargs)
+			except Exception as error:
+				self._recordCall(key, 'raise', error)
+				raise
 			
+			if inspect.isawaitable(result):
+				return self._recordAwaitable(key, result)
 			
-	def _preventExecutionPlansDuplicates(self):
+			self._recordCall(key, 'return', result)
+			return result
+		
+		return recordCall, 'real'
+	
+	async def _recordAwaitable(self, key, awaitable):
+		try:
+			result = await awaitable
+		except Exception as error:
+			self._recordCall(key, 'raise', error)
+			raise
+		
+		self._recordCall(key, 'return', result)
+		return result
+	
+	def _recordCall(self, key, outcome, value):
 		'''
-			Removing duplicated plans
+			Keeping the pickled outcome of a real call, saved in "cassette" at the end of the execution. Not recorded if it cannot be pickled
 		'''
 		
-		final_plans = []
-		for plan in self._execution_plans:
-			_modules_in_plan = []
-			for _module in plan:
-				_modules_in_plan.append(_module.__name__)
-				
-			if _modules_in_plan not in self._loaded_plans:
-				self._loaded_plans.append(_modules_in_plan)
-				final_plans.append(plan)
-				
-		self._execution_plans = final_plans
-		
+		try:
+			self._recorded_calls[key] = pickle.dumps((outcome, value))
+			self._print('Call recorded:', key[0], level= 1)
+		except (pickle.PicklingError, TypeError, AttributeError):
+			self._print('Result cannot be pickled, call not recorded:', key[0], level= 1)
 	
-	def _checkRelationship(self, obj, attr, check_obj):
+	def _replayCall(self, recorded):
 		'''
-			If verbose mode is enable, print out if the reversed relation is not found
+			Returning a copy of the recorded result, or raising the recorded exception
 		'''
 		
-		if self._verbose == True:
-			if (hasattr(obj, attr) == False):
-				self._print(f'{obj} do not have {check_obj} in {attr}', level= 1)
-			else:
-				_imported_modules = []
-				for _module in getattr(obj, attr):
-					_imported_modules.append(self._importModule(_module))
-					
-				if check_obj not in _imported_modules:
-					self._print(f'{obj} do not have {check_obj} in {attr}', level= 1)
-
-	def _getParentPlans(self, plans):
+		outcome, value = pickle.loads(recorded)
+		if outcome == 'raise':
+			raise value
+		
+		return value
+	
+	def _saveCassette(self):
 		'''
-			From a plan, create the parent tree
+			Adding the calls recorded during the execution to "cassette"
 		'''
 		
-		new_plans = []
-		dependencies_found = False
-		for plan in plans:
-			if hasattr(plan[0], 'dependencies'):
-				dependencies_found = True
-				if self._parent_execution_plan == 'all':
-					for dependency in plan[0].dependencies:
-						dependency = self._importModule(dependency)
-						new_plans.append([dependency] + plan.copy())
-						
-						# Relationship verification
-						self._checkRelationship(dependency, 'children', plan[-1])
-						
-				else:
-					idx = 0
-					if self._parent_execution_plan == 'random':
-						idx = random.randint(0, len(plan[0].dependencies) -1)
-						
-					dependency = self._importModule(plan[0].dependencies[idx])
-					new_plans.append([dependency] + plan.copy())
-					
-					# Relationship verification
-					self._checkRelationship(dependency, 'children', plan[-1])
-					
-			else:
-				new_plans.append(plan.copy())
-				
-		self._checkInfiniteLoop(new_plans)
+		if self._cassette is None or len(self._recorded_calls) == 0:
+			return
 		
-		if dependencies_found == True:
-			plans = self._getParentPlans(new_plans)
-			
-		return plans
+		calls = {**self._getCassetteCalls(), **self._recorded_calls}
+		os.makedirs(os.path.dirname(os.path.abspath(self._cassette)), exist_ok= True)
+		with open(f'{self._cassette}.tmp', 'wb') as file:
+			pickle.dump({'version': 1, 'calls': calls}, file, protocol= 4)
+		os.replace(f'{self._cassette}.tmp', self._cassette)
+		
+		self._cassette_calls = calls
+		self._recorded_calls = {}
+	
+	
+	
+	def returnValue(self, value):
+		'''
+			Simply return the passed values. Useful when just a value needs to be faked out during unit test
+		'''
+		
+		return value
 	
+	def returnValues(self, *values):
+		'''
+			Simply return the passed value. Useful when just a value needs to be faked out during unit test
+		'''
+		
+		return values
 	
 	
-	def _getChildrenPlans(self, plans):
+	def _startAction(self, module):
 		'''
-			From a plan, create the children tree
+			Instantiating the test-class and returning the parameters to pass to its trigger
+			pooltest        : Storing the current class executed for the unit test. Passing memory to access previous stored data
+			trigger_params  : Parameters (dict) to pass from the class to the triggered function
 		'''
 		
-		new_plans = []
-		dependencies_found = False
-		# print(plans)
-		for plan in plans:
+		self._print('\n\n========= START:', module.__name__, '=========\n')
+		if self._verbose == True:
+			# Written before the output of the production code of the action
+			Output.flush()
+		
+		init_params = {}
+		if hasattr(module, 'memory'):
+			init_params = {'memory': self._memory.push(module)}
+
+		self._log = True
+		if hasattr(module, 'log') and module.log == False:
+			self._log = False
 			
-			if hasattr(plan[-1], 'children'):
-				dependencies_found = True
-				if self._children_execution_plan == 'all':
-					for child in plan[-1].children:
-						child = self._importModule(child)
-						new_plans.append(plan.copy() + [child])
-						
-						# Relationship verification
-						self._checkRelationship(child, 'dependencies', plan[-1])
-						
-						
-				else:
-					idx = 0
-					if self._children_execution_plan == 'random':
-						idx = random.randint(0, len(plan[-1].children) -1)
-						
-					child = self._importModule(plan[-1].children[idx])
-					new_plans.append(plan.copy() + [child])
-					
-					# Relationship verification
-					self._checkRelationship(child, 'dependencies', plan[-1])
-			else:
-				new_plans.append(plan.copy())
 			
-		self._checkInfiniteLoop(new_plans)
+		if hasattr(module, 'init_params'):
+			init_params = {**init_params, **module.init_params}
+		
+		self._pooltest = module(**init_params)
+		
+		context = self._getContext()
+		self._buildDispatchTable(context)
+		self._bindDirectCalls(context)
+		
 		
-		if dependencies_found == True:
-			plans = self._getChildrenPlans(new_plans)
+		params = {}
+		if hasattr(self._pooltest, 'trigger_params'):
+			params = self._pooltest.trigger_params
 			
-		return plans
-	
+		return params
 	
-	
-	def _createExecutionPlans(self, module):
+	def _endAction(self, module):
 		'''
-			Manage and put together the parent tree and children tree
+			Passing the memory of the test-class to the next one
 		'''
 		
-		current_plans = [[module]]
+		# Updating the memory attribute
+		if hasattr(self._pooltest, 'memory'):
+			memory = self._pooltest.memory
+			if isinstance(memory, LayeredMemory) == False:
+				memory = LayeredMemory(memory, owner= module)
+			self._memory = memory
+			
+		self._direct_calls = None
+		context = self._getContext()
+		if context.dispatch_owner is not context.pooltest:
+			self._buildDispatchTable(context)
+			
+		unused_fakes = sorted(self._getFakeNames(module) - context.fakes_called)
+		if len(unused_fakes) > 0:
+			self._print('Fake methods never called:', ', '.join(unused_fakes), level= 1)
+		context.fake_usage = {'unused_fakes': unused_fakes, 'overrides_without_fake': sorted(context.real_called)}
 		
-		self._print('Checking relationships...')
-		current_plans = self._getParentPlans(current_plans)
-		current_plans = self._getChildrenPlans(current_plans)
+		self._print('\n========= END:', module.__name__, '=========\n')
+		if self._verbose == True:
+			Output.flush()
+	
+	def _run(self, module, prefix = None):
+		'''
+			Executing all the main functions of a class
+			trigger         : Action (function) to trigger for the unit test
+			finalCheck     : Final check after the action is complete
+			prefix          : Plan up to this test-class, naming its profiles
+		'''
+		
+		if self._is_enabled == True:
+			module  = self._importModule(module)
+			timings = {}
+			start   = perf_counter()
+			try:
+				with self._profileAction(module, prefix):
+					params = self._startAction(module)
+					timings['instantiate'] = perf_counter() - start
+					
+					if hasattr(module, 'trigger'):
+						step = perf_counter()
+						self._checkNotAwaitable(module.trigger(**params, UT= self), module, 'trigger')
+						timings['trigger'] = perf_counter() - step
+					
+					if hasattr(self._pooltest, 'finalCheck'):
+						step = perf_counter()
+						self._checkNotAwaitable(self._pooltest.finalCheck(), module, 'finalCheck')
+						timings['finalCheck'] = perf_counter() - step
+						
+					self._endAction(module)
+			finally:
+				self._recordAction(module, timings, perf_counter() - start)
+	
+	def _checkNotAwaitable(self, result, module, step):
+		'''
+			Raising an error when a coroutine trigger or final check is run by "execute": it would never be awaited
+		'''
+		
+		if inspect.isawaitable(result):
+			if inspect.iscoroutine(result):
+				result.close()
+			raise Exception(f'The {step} of {module.__name__} returned an awaitable: use "executeAsync" to await it')
+	
+	async def _runAsync(self, module, prefix = None):
+		'''
+			Same as "_run", awaiting the trigger and the final check when they are coroutines
+		'''
+		
+		if self._is_enabled == True:
+			module  = self._importModule(module)
+			timings = {}
+			start   = perf_counter()
+			try:
+				with self._profileAction(module, prefix):
+					params = self._startAction(module)
+					timings['instantiate'] = perf_counter() - start
+					
+					if hasattr(module, 'trigger'):
+						step    = perf_counter()
+						result  = module.trigger(**params, UT= self)
+						if inspect.isawaitable(result):
+							await result
+						timings['trigger'] = perf_counter() - step
+					
+					if hasattr(self._pooltest, 'finalCheck'):
+						step    = perf_counter()
+						result  = self._pooltest.finalCheck()
+						if inspect.isawaitable(result):
+							await result
+						timings['finalCheck'] = perf_counter() - step
+						
+					self._endAction(module)
+			finally:
+				self._recordAction(module, timings, perf_counter() - start)
+	
+	@contextmanager
+	def _profileAction(self, module, prefix):
+		'''
+			Profiling the block with cProfile and/or tracemalloc according to "profile" and "profile_actions".
+			The files are named after the test-class and the digest of the plan up to it
+		'''
+		
+		if self._profile is None or (self._profile_actions is not None and self._getImportPath(module) not in {self._getImportPath(action) for action in self._profile_actions}):
+			yield
+			return
+		
+		if self._profile not in ('cpu', 'memory', 'all'):
+			raise Exception(f'Unknown profile "{self._profile}". Accepted values are "cpu", "memory" and "all"')
+		
+		profiler        = None
+		stop_tracing    = False
+		if self._profile in ('memory', 'all') and tracemalloc.is_tracing() == False:
+			tracemalloc.start()
+			stop_tracing = True
+		if self._profile in ('cpu', 'all'):
+			profiler = cProfile.Profile()
+			profiler.enable()
+			
+		try:
+			yield
+		finally:
+			if profiler is not None:
+				profiler.disable()
+			snapshot = tracemalloc.take_snapshot() if self._profile in ('memory', 'all') else None
+			if stop_tracing == True:
+				tracemalloc.stop()
+				
+			os.makedirs(self._profile_dir, exist_ok= True)
+			digest  = self.getPlanDigest(prefix if prefix is not None else [module])[:16]
+			path    = os.path.join(self._profile_dir, re.sub(r'[^\w.-]', '_', f'{self._getImportPath(module)}-{digest}'))
+			if profiler is not None:
+				profiler.dump_stats(f'{path}.pstats')
+			if snapshot is not None:
+				snapshot.dump(f'{path}.tracemalloc')
+			self._print('Profile written: ', path, level= 1)
+	
+	def _recordAction(self, module, timings, duration):
+		'''
+			Timings of a test-class (instantiate, trigger, finalCheck) and the override ids it used, kept in the RunContext until the plan is recorded
+		'''
+		
+		context = self._getContext()
+		context.actions.append({'plan': None, 'module': self._getImportPath(module), **timings, 'total': duration, **(context.fake_usage or {})})
+		context.fake_usage = None
+	
+	def _recordPlan(self, execution_plan, duration, error = None):
+		'''
+			Adding to the RunReport the plan and the timings collected in the RunContext since the previous plan
+		'''
+		
+		context     = self._getContext()
+		fingerprint = self.getPlanFingerprint(execution_plan)
+		for action in context.actions:
+			action['plan'] = fingerprint
+			
+		self._report.add(context.actions, [{
+			'plan'      : fingerprint,
+			'duration'  : duration,
+			'status'    : 'passed' if error is None else 'failed',
+			'error'     : None if error is None else f'{type(error).__name__}: {error}',
+			'traceback' : None if error is None else traceback.format_exc(),
+		}], context.overrides)
+		
+		context.actions     = []
+		context.overrides   = {}
+		self._closeOverrideCache(context)
+		Output.flush()
+	
+	def getReport(self):
+		'''
+			RunReport of the last execution (also returned by "execute")
+		'''
+		
+		return self._report
+	
+	
+	def _runExecutionPlan(self, execution_plan):
+		'''
+			Running an execution plan
+		'''
+		
+		if self._is_enabled == True:
+			with self._newRunContext():
+				self._print('Running execution plan: ', execution_plan)
+				start = perf_counter()
+				try:
+					for idx, module in enumerate(execution_plan):
+						self._run(module, execution_plan[:idx + 1] if self._profile is not None else None)
+				except BaseException as error:
+					self._recordPlan(execution_plan, perf_counter() - start, error)
+					raise
+				
+				self._recordPlan(execution_plan, perf_counter() - start)
+	
+	async def _runExecutionPlanAsync(self, execution_plan):
+		'''
+			Running an execution plan on the event loop
+		'''
+		
+		if self._is_enabled == True:
+			with self._newRunContext():
+				self._print('Running execution plan: ', execution_plan)
+				start = perf_counter()
+				try:
+					for idx, module in enumerate(execution_plan):
+						await self._runAsync(module, execution_plan[:idx + 1] if self._profile is not None else None)
+				except asyncio.CancelledError:
+					# Stopped by "fail_fast": the plan is left out of the RunReport, "run_history" and "result_cache", like the plans never started
+					raise
+				except BaseException as error:
+					self._recordPlan(execution_plan, perf_counter() - start, error)
+					raise
+				
+				self._recordPlan(execution_plan, perf_counter() - start)
+	
+	
+	
+	
+	def _getRoot(self, module):
+		'''
+			Id of a test-class in the compiled graph, after making sure no plan built from it loops infinitely
+		'''
+		
+		graph   = self._getGraph()
+		root    = graph.getId(module)
+		
+		loop = graph.findLoop(root, self._parent_execution_plan, self._children_execution_plan, self._count_limit_identify_infinite_loop)
+		if loop is not None:
+			raise Exception(f'Possible infinite loop identified on {graph.getModule(loop).__name__}')
+		
+		return root
+	
+	def _isPairingEdges(self):
+		'''
+			With "edges" on both sides, the parent paths and children paths are paired instead of combined
+		'''
+		
+		return self._parent_execution_plan == 'edges' and self._children_execution_plan == 'edges'
+	
+	def _splitPlanIndex(self, idx, count_parents, count_children):
+		'''
+			Position of the parent path and of the children path of the plan at the position "idx"
+		'''
+		
+		if self._isPairingEdges() == True:
+			return idx % count_parents, idx % count_children
+		
+		return idx // count_children, idx % count_children
+	
+	def _countSidePaths(self, root, attr, execution_plan):
+		'''
+			Number of paths on one side of root and their total length
+		'''
+		
+		if execution_plan == 'edges':
+			paths = self._getGraph().coverEdges(root, attr)
+			return len(paths), sum(len(path) for path in paths)
+		
+		return self._getGraph().countPaths(root, attr, execution_plan)
+	
+	def _estimateModulePlans(self, module):
+		'''
+			Number of plans built from a test-class and their total number of actions, computed on the compiled graph
+		'''
+		
+		graph   = self._getGraph()
+		root    = self._getRoot(module)
+		
+		if self._isPairingEdges() == True:
+			parent_paths    = graph.coverEdges(root, 'dependencies')
+			children_paths  = graph.coverEdges(root, 'children')
+			count           = max(len(parent_paths), len(children_paths))
+			return count, sum(len(parent_paths[idx % len(parent_paths)]) + len(children_paths[idx % len(children_paths)]) - 1 for idx in range(count))
+		
+		count_parents, length_parents   = self._countSidePaths(root, 'dependencies', self._parent_execution_plan)
+		count_children, length_children = self._countSidePaths(root, 'children', self._children_execution_plan)
+		
+		# Root is both at the end of the parent paths and at the beginning of the children paths
+		return count_parents * count_children, length_parents * count_children + length_children * count_parents - count_parents * count_children
+	
+	def estimatePlans(self, list_unit_tests = []):
+		'''
+			Number of plans "preparePlans" would build from the list, and their total number of actions, without building them.
+			Duplicated plans are counted: the result is an upper bound when the list contains related test-classes
+		'''
+		
+		estimate = {'plans': 0, 'actions': 0}
+		for unit_test in list_unit_tests:
+			if isinstance(unit_test, list):
+				count, length = 1, len(unit_test)
+			else:
+				count, length = self._estimateModulePlans(unit_test)
+				
+			estimate['plans']   += count
+			estimate['actions'] += length
+			
+		Output.flush()
+		return estimate
+	
+	def _getSidePath(self, root, attr, execution_plan, index):
+		'''
+			Path at the position "index" on one side of root. "random" has a single path, built randomly
+		'''
+		
+		graph = self._getGraph()
+		if execution_plan == 'random':
+			return list(next(graph.iterPaths(root, attr, lambda relations: self._selectRelations(relations, execution_plan))))
+		
+		if execution_plan == 'edges':
+			return graph.coverEdges(root, attr)[index]
+		
+		return graph.getPathAt(root, attr, execution_plan, index)
+	
+	def _buildModulePlansAt(self, module, indexes):
+		'''
+			Building only the plans of a test-class at the positions passed, without building the others
+		'''
+		
+		root                = self._getRoot(module)
+		count_parents, _    = self._countSidePaths(root, 'dependencies', self._parent_execution_plan)
+		count_children, _   = self._countSidePaths(root, 'children', self._children_execution_plan)
+		
+		plans = []
+		for idx in indexes:
+			idx_parents, idx_children = self._splitPlanIndex(idx, count_parents, count_children)
+			plans.append(self._buildPlan(
+				self._getSidePath(root, 'dependencies', self._parent_execution_plan, idx_parents),
+				self._getSidePath(root, 'children', self._children_execution_plan, idx_children),
+			))
+			
+		return plans
+	
+	def _sampleIndexes(self, count, quota):
+		'''
+			"quota" distinct positions drawn uniformly among "count", without listing them when "count" is large
+		'''
+		
+		rng = self._getRandom()
+		if quota * 2 > count:
+			return sorted(rng.sample(range(count), quota))
+		
+		indexes = set()
+		while len(indexes) < quota:
+			indexes.add(rng.randrange(count))
+			
+		return sorted(indexes)
+	
+	def _shareBudget(self, quotas, budget):
+		'''
+			Splitting "budget" plans between the test-classes proportionally to their quota, without going above it.
+			The plans left by the rounding go to the largest remainders, in the order of the test-classes
+		'''
+		
+		total   = sum(quotas.values())
+		shares  = {path: budget * quota // total for path, quota in quotas.items()}
+		left    = budget - sum(shares.values())
+		for path in sorted(quotas, key= lambda path: -(budget * quotas[path] % total))[:left]:
+			shares[path] += 1
+			
+		return shares
+	
+	def _selectModulePlans(self, list_unit_tests):
+		'''
+			Positions of the plans to build for each test-class when they are sampled ("sample_plans") or when their estimate is above "max_execution_plans".
+			The test-classes missing from the result get all their plans built
+		'''
+		
+		if self._sample_plans is None and self._max_execution_plans is None:
+			return {}
+		
+		estimates = {}
+		for unit_test in list_unit_tests:
+			if isinstance(unit_test, list) == False:
+				estimates[self._getImportPath(unit_test)] = self._estimateModulePlans(unit_test)[0]
+				
+		quotas = estimates
+		if self._sample_plans is not None:
+			quotas = {path: min(count, self._sample_plans) for path, count in estimates.items()}
+		
+		count_lists = len([unit_test for unit_test in list_unit_tests if isinstance(unit_test, list)])
+		total       = sum(quotas.values()) + count_lists
+		if self._max_execution_plans is not None and total > self._max_execution_plans:
+			if self._max_execution_plans_policy != 'downsample':
+				raise Exception(f'{total} execution plans estimated, above the limit "max_execution_plans" of {self._max_execution_plans}')
+			
+			# The plans passed as lists are never downsampled
+			if count_lists > self._max_execution_plans:
+				raise Exception(f'{count_lists} execution plans passed as lists, above the limit "max_execution_plans" of {self._max_execution_plans}')
+			
+			self._print(f'{total} execution plans estimated, downsampled to {self._max_execution_plans}')
+			quotas = self._shareBudget(quotas, self._max_execution_plans - count_lists)
+			
+		selection = {}
+		for path, count in estimates.items():
+			if self._sample_plans is not None:
+				selection[path] = self._sampleIndexes(count, quotas[path])
+			elif quotas[path] < count:
+				selection[path] = sorted({count * position // quotas[path] for position in range(quotas[path])})
+				
+		return selection
+	
+	def preparePlans(self, list_unit_tests = []):
+		'''
+			Preparing the plans according to the settings and list passed.
+			This function also prepare the execution tree for parents and children possibilities
+		'''
+		
+		if self._is_enabled == True:
+			selection = self._selectModulePlans(list_unit_tests)
+			
+			self._prepared_roots += list_unit_tests
+			for unit_test in list_unit_tests:
+				self._resetCounter()
+				if isinstance(unit_test, list):
+					self._execution_plans.append(unit_test)
+				elif self._getImportPath(unit_test) in selection:
+					self._execution_plans += self._buildModulePlansAt(unit_test, selection[self._getImportPath(unit_test)])
+				else:
+					self._createExecutionPlans(unit_test)
+					
+			self._preventExecutionPlansDuplicates()
+			Output.flush()
+	
+	
+	
+	def getExecutionPlans(self):
+		'''
+			Return all the current execution plans
+		'''
+		
+		return self._execution_plans
+	
+	
+	
+	def resetExecutionPlans(self):
+		'''
+			Resetting the execution plan list
+		'''
+		
+		self._execution_plans    = []
+		self._loaded_plans       = set()
+		self._prepared_roots     = []
+		self._graph              = None
+	
+	
+	
+	def _splitImportPath(self, module):
+		'''
+			(module name, qualified name) of a test-class or of its import path
+		'''
+		
+		if isinstance(module, str):
+			module_name, _, qualname = module.rpartition('.')
+			return module_name, qualname
+		
+		return module.__module__, module.__qualname__
+	
+	def _getModuleFileHash(self, module_name):
+		'''
+			Hash of the file of a python module, found without importing it. None when the module has no file (built dynamically...)
+		'''
+		
+		module  = sys.modules.get(module_name)
+		path    = getattr(module, '__file__', None)
+		if path is None:
+			try:
+				spec = importlib.util.find_spec(module_name)
+				path = spec.origin if spec is not None else None
+			except (ImportError, ValueError):
+				path = None
+				
+		if path is None or os.path.isfile(path) == False:
+			return None
+		
+		with open(path, 'rb') as file:
+			return sha1(file.read()).hexdigest()
+	
+	def _getPlanSetHash(self, list_unit_tests, module_names):
+		'''
+			Hash of the files of the modules of a plan set, of the test-classes it was prepared from and of the settings building the plans.
+			None when one of the modules has no file: the plan set cannot be checked and is always rebuilt
+		'''
+		
+		file_hashes = {}
+		for module_name in sorted(module_names):
+			file_hashes[module_name] = self._getModuleFileHash(module_name)
+			if file_hashes[module_name] is None:
+				return None
+			
+		graph = {
+			'version'   : _PLAN_SET_VERSION,
+			'settings'  : {setting: getattr(self, f'_{setting}') for setting in _PLAN_SET_SETTINGS},
+			'roots'     : [self.getPlanFingerprint(unit_test) if isinstance(unit_test, list) else self._getImportPath(unit_test) for unit_test in list_unit_tests],
+			'modules'   : file_hashes,
+		}
+		return sha1(json.dumps(graph, sort_keys= True, default= str).encode('utf-8')).hexdigest()
+	
+	def exportPlans(self, path):
+		'''
+			Writing the prepared plans to a JSON file, loaded back by "loadPlans".
+			The test-classes are written once in a table, the plans as lists of indexes in this table
+		'''
+		
+		classes = []
+		ids     = {}
+		
+		def getId(module):
+			key = self._splitImportPath(module)
+			if key not in ids:
+				ids[key] = len(classes)
+				classes.append(key)
+			return ids[key]
+		
+		plans = [[getId(module) for module in plan] for plan in self._execution_plans]
+		
+		# The test-classes reached while preparing the plans are part of the graph hash even if no plan goes through them
+		if self._graph is not None:
+			for module in self._graph.getModules():
+				getId(module)
+				
+		graph_hash = self._getPlanSetHash(self._prepared_roots, {module_name for module_name, qualname in classes})
+		if graph_hash is None:
+			self._print('Some test-classes have no source file, the plans exported will be prepared again when loaded: ', path)
+			
+		directory = os.path.dirname(os.path.abspath(path))
+		os.makedirs(directory, exist_ok= True)
+		with open(f'{path}.tmp', 'w') as file:
+			json.dump({'version': _PLAN_SET_VERSION, 'graph_hash': graph_hash, 'classes': classes, 'plans': plans}, file, separators= (',', ':'))
+		os.replace(f'{path}.tmp', path)
+	
+	def loadPlans(self, path, list_unit_tests = []):
+		'''
+			Replacing the prepared plans with the ones exported to "path" from the same "list_unit_tests" and settings.
+			When the file is missing or one of the modules of its test-classes changed, the plans are prepared and exported again.
+			Returns True if the plans were loaded from the file, False if they were prepared again
+		'''
+		
+		if self._is_enabled == True:
+			self.resetExecutionPlans()
+			
+			plan_set = None
+			if os.path.exists(path) == True:
+				with open(path) as file:
+					plan_set = json.load(file)
+					
+			if plan_set is not None and plan_set.get('version') == _PLAN_SET_VERSION and plan_set['graph_hash'] is not None:
+				graph_hash = self._getPlanSetHash(list_unit_tests, {module_name for module_name, qualname in plan_set['classes']})
+				if graph_hash == plan_set['graph_hash']:
+					classes = [f'{module_name}.{qualname}' for module_name, qualname in plan_set['classes']]
+					# Kept as import paths: the test-classes are only imported when their plan is run
+					self._execution_plans   = [[classes[id] for id in plan] for plan in plan_set['plans']]
+					self._prepared_roots    = list(list_unit_tests)
+					self._preventExecutionPlansDuplicates()
+					self._print(f'{len(self._execution_plans)} execution plan(s) loaded from: ', path)
+					Output.flush()
+					return True
+				
+			self._print('Plans missing or outdated, preparing them again: ', path)
+			self.preparePlans(list_unit_tests)
+			self.exportPlans(path)
+			return False
+		
+		return False
+	
+	
+	
+	def _buildPlansTrie(self, execution_plans):
+		'''
+			Grouping the execution plans by common prefixes.
+			Each node: {'module': test-class, 'ends': number of plans ending on this node, 'children': {test-class: node}}
+		'''
+		
+		root = {'module': None, 'ends': 0, 'children': {}}
+		for execution_plan in execution_plans:
+			node = root
+			for module in execution_plan:
+				if module not in node['children']:
+					node['children'][module] = {'module': module, 'ends': 0, 'children': {}}
+				node = node['children'][module]
+			node['ends'] += 1
+			
+		return root
+	
+	def _iterTriePlans(self, node, prefix):
+		'''
+			Execution plans ending on the node or below it, "prefix" being the plan up to the node
+		'''
+		
+		if node['ends'] > 0:
+			yield prefix
+			
+		for branch in node['children'].values():
+			yield from self._iterTriePlans(branch, prefix + [branch['module']])
+	
+	def _checkpoint(self, prefix):
+		'''
+			Saving the memory and the state declared by the test-classes with "snapshotState" before running sibling branches
+		'''
+		
+		states = []
+		for module in prefix:
+			module = self._importModule(module)
+			if hasattr(module, 'snapshotState') and hasattr(module, 'restoreState'):
+				states.append((module, module.snapshotState()))
+				
+		# The layers of the memory are never written once their test-class is executed: no copy needed
+		return {'memory': self._memory, 'states': states}
+	
+	def _restoreCheckpoint(self, checkpoint):
+		'''
+			Restoring the memory and the states saved by "_checkpoint"
+		'''
+		
+		self._memory = checkpoint['memory']
+		for module, state in checkpoint['states']:
+			module.restoreState(state)
+	
+	def _runPlansTrie(self, node, prefix = [], elapsed = 0.0, fail_fast = True):
+		'''
+			Running each shared prefix once. The memory is checkpointed where the plans branch out and restored for each sibling branch.
+			elapsed: Time spent running the prefix, counted in the duration of every plan sharing it
+			fail_fast: If false, a failure only stops the plans sharing the failed prefix, the sibling branches are still run
+		'''
+		
+		if node['module'] is not None:
+			prefix  = prefix + [node['module']]
+			start   = perf_counter()
+			try:
+				self._run(node['module'], prefix)
+			except BaseException as error:
+				# Every plan going through the failed test-class fails with it, none of them is run further
+				for execution_plan in self._iterTriePlans(node, prefix):
+					self._recordPlan(execution_plan, elapsed + perf_counter() - start, error)
+				raise
+			
+			elapsed += perf_counter() - start
+			if node['ends'] > 0:
+				self._recordPlan(prefix, elapsed)
+			
+		branches = list(node['children'].values())
+		if len(branches) == 0:
+			return
+		
+		checkpoint = None
+		if len(branches) > 1:
+			checkpoint = self._checkpoint(prefix)
+			
+		for idx, branch in enumerate(branches):
+			if node['module'] is None:
+				self._resetMemory()
+				self._print('Running execution plans starting with: ', branch['module'])
+			elif idx > 0:
+				self._restoreCheckpoint(checkpoint)
+				self._print('Resuming execution plans from: ', prefix)
+				
+			try:
+				self._runPlansTrie(branch, prefix, elapsed, fail_fast)
+			except (KeyboardInterrupt, SystemExit):
+				raise
+			except BaseException:
+				if fail_fast == True:
+					raise
+	
+	
+	
+	def _runPlans(self, execution_plans, share_prefixes, fail_fast = True):
+		'''
+			Running execution plans one after the other, or sharing their prefixes.
+			fail_fast: If false, the failures are only added to the RunReport and the next plans are run
+		'''
+		
+		if share_prefixes == True:
+			with self._newRunContext():
+				self._runPlansTrie(self._buildPlansTrie(execution_plans), fail_fast= fail_fast)
+		else:
+			for ep in execution_plans:
+				try:
+					self._runExecutionPlan(ep)
+				except (KeyboardInterrupt, SystemExit):
+					raise
+				except BaseException:
+					if fail_fast == True:
+						raise
+	
+	def _runPlansCollectingFailure(self, execution_plans, share_prefixes, fail_fast = True):
+		'''
+			Running execution plans in a worker (thread or process). The failure is returned instead of being raised
+		'''
+		
+		try:
+			self._runPlans(execution_plans, share_prefixes, fail_fast)
+		except (KeyboardInterrupt, SystemExit):
+			raise
+		except BaseException:
+			return {'plans': execution_plans, 'error': traceback.format_exc()}
 		
-		self._execution_plans += current_plans
-	
\ No newline at end of file
+		return {'plans': execution_plans, 'error': None}
+	
+	def _executeInWorkers(self, workers, share_prefixes, pool, fail_fast = True):
+		'''
+			Distributing the execution plans across a pool of processes or threads.
+			The test-classes are passed to the processes as import paths. Threads share this UnitTest, each plan having its own RunContext.
+			With "share_prefixes", consecutive plans are sent together so the workers can still share their prefixes.
+			With "fail_fast", the groups of plans not started yet are cancelled after the first failure
+		'''
+		
+		execution_plans = self._execution_plans
+		if pool == 'process':
+			execution_plans = [self.getPlanFingerprint(ep) for ep in execution_plans]
+		
+		chunk_size = 1
+		if share_prefixes == True:
+			chunk_size = max(1, len(execution_plans) // (workers * 4))
+		chunks = [execution_plans[idx:idx + chunk_size] for idx in range(0, len(execution_plans), chunk_size)]
+		
+		if pool == 'thread':
+			if self._profile is not None:
+				raise Exception('"profile" cannot be combined with a pool of threads, cProfile and tracemalloc profile the whole process')
+			
+			executor    = ThreadPoolExecutor(max_workers= workers)
+			submit      = lambda chunk: executor.submit(self._runPlansCollectingFailure, chunk, share_prefixes, fail_fast)
+		else:
+			settings    = {**self._getSettings(), 'is_enabled': True}
+			executor    = ProcessPoolExecutor(max_workers= workers, initializer= _initWorker, initargs= (list(sys.path),))
+			submit      = lambda chunk: executor.submit(_runPlansInWorker, settings, chunk, share_prefixes, fail_fast)
+			
+		with executor:
+			futures = [submit(chunk) for chunk in chunks]
+			for future in as_completed(futures):
+				if fail_fast == True and future.result()['error'] is not None:
+					for pending in futures:
+						pending.cancel()
+					break
+					
+		results = [future.result() for future in futures if future.cancelled() == False]
+		if pool == 'process':
+			for result in results:
+				self._report.merge(result['report'])
+				self._recorded_calls.update(result['recorded_calls'])
+			
+		failures = [result for result in results if result['error'] is not None]
+		for failure in failures:
+			self._printSummary('Execution plans failed: ', list(failure['plans']))
+			self._printSummary(failure['error'], level= 1)
+			
+		if len(failures) > 0:
+			raise Exception(f'{len(failures)} out of {len(chunks)} group(s) of execution plans failed. First failure in {list(failures[0]["plans"])}:\n{failures[0]["error"]}')
+	
+	
+	
+	def execute(self, list_unit_tests = None, share_prefixes = False, workers = None, stream = False, pool = 'process', force = False, fail_fast = True, shard_index = None, shard_count = None, shard_balance = False):
+		'''
+			Entry point to start the unit tests
+			Either prepare a list and execute or pass the list as argument to perform both actions at once
+			
+			share_prefixes: If true, the actions shared at the beginning of multiple plans are executed only once.
+			                The memory is restored for each branch; the state outside the memory (files, database...) is only restored for test-classes implementing "snapshotState" and "restoreState"
+			
+			workers: Number of processes or threads executing the plans in parallel
+			
+			pool: "process" (the test-classes must be importable from their module) or "thread" (sharing the imports, for I/O-bound plans)
+			
+			stream: If true, each plan from "list_unit_tests" is executed as soon as it is built, without preparing all the plans first
+			
+			force: If true, the plans found in "result_cache" are executed anyway
+			
+			fail_fast: If true, the execution stops at the first failure. Otherwise all the plans are run and all the failures are raised at the end in one exception
+			
+			shard_index / shard_count: Only executing the plans of the shard "shard_index" (from 0) out of "shard_count" (see "getShardPlans")
+			shard_balance: If true, the shards are balanced with the durations of "run_history" instead of the digests of the plans
+			
+			Returns the RunReport of the execution (timings of the plans, test-classes and overrides), None when disabled
+		'''
+		
+		if self._is_enabled == True:
+			self._startExecution()
+			try:
+				
+				if stream == True and list_unit_tests != None:
+					if share_prefixes == True or (workers != None and workers > 1):
+						raise Exception('"stream" cannot be combined with "share_prefixes" or "workers", all the plans are needed upfront')
+					
+					if shard_count != None and shard_balance == True:
+						raise Exception('"stream" cannot be combined with "shard_balance", all the plans are needed upfront')
+					
+					plans = (ep for ep in self.iterPlans(list_unit_tests) if self._isInShard(ep, shard_index, shard_count) and (force == True or self._isPlanCached(ep) == False))
+					self._runPlans(plans, False, fail_fast)
+					return self._endReport()
+				
+				if list_unit_tests != None:
+					self.preparePlans(list_unit_tests)
+					
+				# Sharding before skipping the cached plans: the shards do not depend on the cache of each machine
+				execution_plans         = self._selectShard(self._execution_plans, shard_index, shard_count, shard_balance)
+				self._execution_plans   = self._schedulePlans([ep for ep in execution_plans if force == True or self._isPlanCached(ep) == False])
+				
+				try:
+					if workers != None and workers > 1:
+						self._executeInWorkers(workers, share_prefixes, pool, fail_fast)
+					else:
+						self._runPlans(self._execution_plans, share_prefixes, fail_fast)
+				finally:
+					self.resetExecutionPlans()
+					
+				return self._endReport()
+			finally:
+				self._endExecution()
+			
+			
+			
+	async def executeAsync(self, list_unit_tests = None, concurrency = 1, force = False, fail_fast = True, shard_index = None, shard_count = None, shard_balance = False):
+		'''
+			Same as "execute" on the event loop: coroutine triggers and final checks are awaited.
+			concurrency: Number of plans running at the same time. Each plan runs in its own task, with its own RunContext.
+			             With "fail_fast", the other plans are cancelled at the first failure
+		'''
+		
+		if self._is_enabled == True:
+			self._startExecution()
+			try:
+				
+				if list_unit_tests != None:
+					self.preparePlans(list_unit_tests)
+					
+				execution_plans         = self._selectShard(self._execution_plans, shard_index, shard_count, shard_balance)
+				self._execution_plans   = self._schedulePlans([ep for ep in execution_plans if force == True or self._isPlanCached(ep) == False])
+				
+				if self._profile is not None and concurrency > 1:
+					raise Exception('"profile" cannot be combined with a "concurrency" above 1, cProfile and tracemalloc profile the whole process')
+				
+				semaphore = asyncio.Semaphore(concurrency)
+				
+				async def runPlan(execution_plan):
+					async with semaphore:
+						await self._runExecutionPlanAsync(execution_plan)
+						
+				try:
+					tasks = [asyncio.ensure_future(runPlan(ep)) for ep in self._execution_plans]
+					if len(tasks) > 0:
+						done, pending = await asyncio.wait(tasks, return_when= asyncio.FIRST_EXCEPTION if fail_fast == True else asyncio.ALL_COMPLETED)
+						for task in pending:
+							task.cancel()
+						await asyncio.gather(*pending, return_exceptions= True)
+				finally:
+					self.resetExecutionPlans()
+					
+				# Retrieving every exception, the failures are in the RunReport
+				errors = [task.exception() for task in tasks if task.cancelled() == False and task.exception() is not None]
+				if fail_fast == True and len(errors) > 0:
+					raise errors[0]
+					
+				return self._endReport()
+			finally:
+				self._endExecution()
+	
+	def _startExecution(self):
+		'''
+			New RunReport, loading "result_cache" and "run_history"
+		'''
+		
+		self._report         = RunReport()
+		self._cassette_calls = None
+		self._override_cache = None
+		self._loadResultCache()
+		self._loadRunHistory()
+	
+	def _endExecution(self):
+		'''
+			Saving the outcome of the execution in "result_cache", "run_history" and "cassette"
+		'''
+		
+		self._closeOverrideCache()
+		self._saveResultCache()
+		self._saveRunHistory()
+		self._saveCassette()
+		Output.flush()
+	
+	def _endReport(self):
+		'''
+			Displaying the summary of the RunReport in verbose mode. Raising all the failures at once when the execution did not stop at the first one
+		'''
+		
+		self._closeOverrideCache()
+		self._printSummary(self._report)
+		
+		failures = self._report.getFailures()
+		if len(failures) > 0:
+			for failure in failures:
+				self._printSummary('Execution plan failed: ', list(failure['plan']))
+				self._printSummary(failure['traceback'], level= 1)
+			
+			raise Exception(f'{len(failures)} out of {len(self._report.plans)} execution plan(s) failed:\n' + '\n'.join(f'{"":4}{" > ".join(failure["plan"])}: {failure["error"]}' for failure in failures))
+		
+		return self._report
+	
+	
+	
+	def _loadRunHistory(self):
+		'''
+			Loading the last duration and outcome of each plan from "run_history"
+		'''
+		
+		self._history = None
+		if self._run_history is not None:
+			self._history = {}
+			if os.path.exists(self._run_history) == True:
+				with open(self._run_history) as file:
+					self._history = json.load(file)['plans']
+	
+	def getRunHistory(self):
+		'''
+			Last duration and outcome of each plan, by plan digest: {'duration': s, 'status': 'passed' or 'failed', 'time': timestamp}.
+			Empty when "run_history" is not set
+		'''
+		
+		if self._history is None:
+			self._loadRunHistory()
+			
+		return self._history if self._history is not None else {}
+	
+	def _schedulePlans(self, execution_plans):
+		'''
+			With "run_history": the plans which failed last time first, then the plans never run, then the longest ones first
+		'''
+		
+		if self._history is None:
+			return execution_plans
+		
+		def priority(execution_plan):
+			entry = self._history.get(self.getPlanDigest(execution_plan))
+			if entry is None:
+				return (1, 0.0)
+			
+			return (0 if entry['status'] == 'failed' else 2, -entry['duration'])
+		
+		return sorted(execution_plans, key= priority)
+	
+	def _checkShard(self, shard_index, shard_count):
+		'''
+			Raising an error when the shard arguments are not both None or a valid shard
+		'''
+		
+		if (shard_index is None) != (shard_count is None):
+			raise Exception('"shard_index" and "shard_count" must be passed together')
+		
+		if shard_count is not None and (shard_count < 1 or shard_index < 0 or shard_index >= shard_count):
+			raise Exception(f'Invalid shard {shard_index} out of {shard_count}: "shard_index" goes from 0 to "shard_count" - 1')
+	
+	def _isInShard(self, plan, shard_index, shard_count):
+		'''
+			True if the digest of the plan assigns it to the shard, the same on every machine
+		'''
+		
+		self._checkShard(shard_index, shard_count)
+		return shard_count is None or int(self.getPlanDigest(plan), 16) % shard_count == shard_index
+	
+	def _selectShard(self, execution_plans, shard_index, shard_count, balance = False):
+		'''
+			Plans of the shard "shard_index" out of "shard_count", all of them when not sharding.
+			With "balance", the plans are taken from the longest to the shortest in "run_history" (the average duration when not recorded),
+			each one assigned to the shard with the lowest total duration so far. Every machine needs the same "run_history" to get the same shards
+		'''
+		
+		self._checkShard(shard_index, shard_count)
+		if shard_count is None:
+			return execution_plans
+		
+		if balance == False:
+			return [ep for ep in execution_plans if self._isInShard(ep, shard_index, shard_count)]
+		
+		history     = self.getRunHistory()
+		digests     = [self.getPlanDigest(ep) for ep in execution_plans]
+		durations   = {digest: history[digest]['duration'] for digest in digests if digest in history}
+		default     = sum(durations.values()) / len(durations) if len(durations) > 0 else 1.0
+		
+		loads       = [0.0] * shard_count
+		selected    = set()
+		for digest in sorted(set(digests), key= lambda digest: (-durations.get(digest, default), digest)):
+			shard = loads.index(min(loads))
+			loads[shard] += durations.get(digest, default)
+			if shard == shard_index:
+				selected.add(digest)
+				
+		return [ep for ep, digest in zip(execution_plans, digests) if digest in selected]
+	
+	def getShardPlans(self, shard_index, shard_count, balance = False, list_unit_tests = None):
+		'''
+			Prepared plans of a shard, as split by "execute" with the same arguments, without executing them. "list_unit_tests" is prepared first if passed
+		'''
+		
+		if list_unit_tests != None:
+			self.preparePlans(list_unit_tests)
+			
+		return self._selectShard(self._execution_plans, shard_index, shard_count, balance)
+	
+	def _saveRunHistory(self):
+		'''
+			Keeping the duration and outcome of the plans executed in "run_history"
+		'''
+		
+		if self._history is None:
+			return
+		
+		now = time.time()
+		for plan in self._report.plans:
+			if plan['status'] in ('passed', 'failed'):
+				self._history[self.getPlanDigest(plan['plan'])] = {'duration': plan['duration'], 'status': plan['status'], 'time': now}
+				
+		os.makedirs(os.path.dirname(os.path.abspath(self._run_history)), exist_ok= True)
+		with open(f'{self._run_history}.tmp', 'w') as file:
+			json.dump({'version': 1, 'plans': self._history}, file)
+		os.replace(f'{self._run_history}.tmp', self._run_history)
+	
+	
+	
+	def _preventExecutionPlansDuplicates(self):
+		'''
+			Removing duplicated plans, compared with their fingerprint
+		'''
+		
+		final_plans         = []
+		self._loaded_plans  = set()
+		for plan in self._execution_plans:
+			fingerprint = self.getPlanFingerprint(plan)
+			if fingerprint not in self._loaded_plans:
+				self._loaded_plans.add(fingerprint)
+				final_plans.append(plan)
+				
+		self._execution_plans = final_plans
+	
+	def getPlanFingerprint(self, plan):
+		'''
+			Stable and hashable identifier of a plan: the import paths of its test-classes.
+			Test-classes and their import paths give the same fingerprint
+		'''
+		
+		return tuple(self._getImportPath(module) for module in plan)
+	
+	def getPlanDigest(self, plan):
+		'''
+			Fixed-length digest of the fingerprint of a plan, usable as a reference across runs (file names, caches...)
+		'''
+		
+		return sha1('\n'.join(self.getPlanFingerprint(plan)).encode('utf-8')).hexdigest()
+	
+	
+	
+	def _getSourceHash(self, module):
+		'''
+			Hash of the modules of a test-class and of its base classes, and of the module of its trigger.
+			None when one of these files is not available (class built dynamically...). Computed once per execution
+		'''
+		
+		path = self._getImportPath(module)
+		if path not in self._source_hashes:
+			module          = self._importModule(module)
+			module_names    = [cls.__module__ for cls in module.__mro__ if cls.__module__ != 'builtins']
+			file_hashes     = [self._getModuleFileHash(module_name) for module_name in dict.fromkeys(module_names)]
+			try:
+				if hasattr(module, 'trigger'):
+					# Unwrapping the decorators (initUT...): the source of the production function, not of the decorator
+					with open(inspect.getsourcefile(inspect.unwrap(module.trigger)), 'rb') as file:
+						file_hashes.append(sha1(file.read()).hexdigest())
+			except (OSError, TypeError):
+				file_hashes.append(None)
+				
+			self._source_hashes[path] = None if None in file_hashes else sha1('\n'.join(file_hashes).encode('utf-8')).hexdigest()
+			
+		return self._source_hashes[path]
+	
+	def _getPlanSourceKey(self, plan):
+		'''
+			Hash of the sources of all the test-classes of a plan, None if one of them is not available
+		'''
+		
+		source_hashes = [self._getSourceHash(module) for module in plan]
+		if None in source_hashes:
+			return None
+		
+		return sha1('\n'.join(source_hashes).encode('utf-8')).hexdigest()
+	
+	def _loadResultCache(self):
+		'''
+			Loading the plans which passed from "result_cache"
+		'''
+		
+		self._source_hashes     = {}
+		self._cached_results    = None
+		if self._result_cache is not None:
+			self._cached_results = {}
+			if os.path.exists(self._result_cache) == True:
+				with open(self._result_cache) as file:
+					self._cached_results = json.load(file)['plans']
+	
+	def _isPlanCached(self, plan):
+		'''
+			True if the plan passed with the current sources of its test-classes. It is added to the RunReport as "cached"
+		'''
+		
+		if self._cached_results is None:
+			return False
+		
+		source_key = self._cached_results.get(self.getPlanDigest(plan))
+		if source_key is None or source_key != self._getPlanSourceKey(plan):
+			return False
+		
+		self._print('Execution plan unchanged since it passed, skipped: ', plan)
+		self._report.add(plans= [{'plan': self.getPlanFingerprint(plan), 'duration': 0.0, 'status': 'cached', 'error': None, 'traceback': None}])
+		return True
+	
+	def _saveResultCache(self):
+		'''
+			Keeping the plans which passed during the execution in "result_cache", forgetting the ones which failed
+		'''
+		
+		if self._cached_results is None:
+			return
+		
+		for plan in self._report.plans:
+			digest = self.getPlanDigest(plan['plan'])
+			if plan['status'] == 'passed':
+				source_key = self._getPlanSourceKey(plan['plan'])
+				if source_key is not None:
+					self._cached_results[digest] = source_key
+			elif plan['status'] == 'failed':
+				self._cached_results.pop(digest, None)
+				
+		directory = os.path.dirname(os.path.abspath(self._result_cache))
+		os.makedirs(directory, exist_ok= True)
+		with open(f'{self._result_cache}.tmp', 'w') as file:
+			json.dump({'version': 1, 'plans': self._cached_results}, file)
+		os.replace(f'{self._result_cache}.tmp', self._result_cache)
+		
+	
+	def _checkRelationship(self, obj, attr, check_obj):
+		'''
+			If verbose mode is enable, print out if the reversed relation is not found
+		'''
+		
+		if self._verbose == True:
+			if (hasattr(obj, attr) == False):
+				self._print(f'{obj} do not have {check_obj} in {attr}', level= 1)
+			else:
+				_imported_modules = []
+				for _module in getattr(obj, attr):
+					_imported_modules.append(self._importModule(_module))
+					
+				if check_obj not in _imported_modules:
+					self._print(f'{obj} do not have {check_obj} in {attr}', level= 1)
+
+	def _getGraph(self):
+		'''
+			Relationships between the test-classes, compiled once for all the plans prepared until the next "resetExecutionPlans"
+		'''
+		
+		if self._graph is None:
+			self._graph = PlanGraph(self._importModule, self._checkRelationship)
+			
+		return self._graph
+	
+	def _getRandom(self):
+		'''
+			Random generator of "random" and "sample_plans", created from "random_seed".
+			Without seed, one is drawn and displayed so the same plans can be built again
+		'''
+		
+		if self._random is None:
+			if self._random_seed is None:
+				self._random_seed = random.SystemRandom().randrange(2 ** 32)
+				Output.installDefaultHandler()
+				Output.summary_logger.info('Random seed: %s (set random_seed= %s to build the same plans again)', self._random_seed, self._random_seed)
+				
+			self._random = random.Random(self._random_seed)
+			
+		return self._random
+	
+	def getRandomSeed(self):
+		'''
+			Seed used to build the random plans, None if no random plan has been built
+		'''
+		
+		if self._random is None:
+			return None
+		
+		return self._random_seed
+	
+	def _selectRelations(self, relations, execution_plan):
+		'''
+			Relations ("dependencies" or "children") to follow according to the execution plan algorithm
+		'''
+		
+		if execution_plan == 'all' or len(relations) == 0:
+			return relations
+		
+		idx = 0
+		if execution_plan == 'random':
+			idx = self._getRandom().randint(0, len(relations) -1)
+			
+		return [relations[idx]]
+	
+	def _buildPlan(self, parent_path, children_path):
+		'''
+			Plan made of the test-classes of a parent path (from root up to the oldest dependency) and of a children path (from root)
+		'''
+		
+		graph = self._getGraph()
+		return [graph.getModule(id) for id in reversed(parent_path)] + [graph.getModule(id) for id in children_path[1:]]
+	
+	def _iterSidePaths(self, root, attr, execution_plan):
+		'''
+			Paths on one side of root according to the execution plan algorithm
+		'''
+		
+		if execution_plan == 'edges':
+			return self._getGraph().coverEdges(root, attr)
+		
+		return self._getGraph().iterPaths(root, attr, lambda relations: self._selectRelations(relations, execution_plan))
+	
+	def _iterModulePlans(self, module):
+		'''
+			Lazily building the parent tree and, for each of its branches, the children tree.
+			Infinite loops are identified on the compiled graph before building any plan.
+			Only the plan being built is kept in memory: proportional to the depth of the relationships, not to the number of plans
+		'''
+		
+		root = self._getRoot(module)
+		
+		if self._isPairingEdges() == True:
+			parent_paths    = self._iterSidePaths(root, 'dependencies', 'edges')
+			children_paths  = self._iterSidePaths(root, 'children', 'edges')
+			for idx in range(max(len(parent_paths), len(children_paths))):
+				yield self._buildPlan(parent_paths[idx % len(parent_paths)], children_paths[idx % len(children_paths)])
+			return
+		
+		for parent_path in self._iterSidePaths(root, 'dependencies', self._parent_execution_plan):
+			for children_path in self._iterSidePaths(root, 'children', self._children_execution_plan):
+				yield self._buildPlan(parent_path, children_path)
+	
+	def iterPlans(self, list_unit_tests = []):
+		'''
+			Same as "preparePlans" but the execution plans are yielded one by one, as soon as they are built.
+			Duplicated plans are skipped. "max_execution_plans" and "sample_plans" are applied like in "preparePlans", from the estimates.
+			The plans of a test-class are all distinct and all go through it: only the plans going through another test-class of the list
+			can be built twice, so only their fingerprints are kept. All of them are kept when the list contains plans
+		'''
+		
+		selection       = self._selectModulePlans(list_unit_tests)
+		roots           = {self._getImportPath(unit_test) for unit_test in list_unit_tests if isinstance(unit_test, list) == False}
+		keep_all        = any(isinstance(unit_test, list) for unit_test in list_unit_tests)
+		done_roots      = set()
+		loaded_plans    = set()
+		for unit_test in list_unit_tests:
+			if isinstance(unit_test, list):
+				plans = [unit_test]
+			else:
+				path = self._getImportPath(unit_test)
+				if path in done_roots:
+					continue
+				done_roots.add(path)
+				
+				if path in selection:
+					plans = self._buildModulePlansAt(unit_test, selection[path])
+				else:
+					self._print('Checking relationships...')
+					plans = self._iterModulePlans(unit_test)
+					
+			for plan in plans:
+				fingerprint = self.getPlanFingerprint(plan)
+				if keep_all == True or len(roots.intersection(fingerprint)) > 1:
+					if fingerprint in loaded_plans:
+						continue
+					loaded_plans.add(fingerprint)
+				yield plan
+	
+	
+	
+	def _createExecutionPlans(self, module):
+		'''
+			Manage and put together the parent tree and children tree
+		'''
+		
+		self._print('Checking relationships...')
+		self._execution_plans += list(self._iterModulePlans(module))
+	
+	
+	
+class DisabledUnitTest(UnitTest):
+	'''
+		Read-only UnitTest with the unit testing disabled.
+		A single instance can be shared by all the entry points running in production, "override" being a direct call
+	'''
+	
+	def __init__(self, **kwargs):
+		super().__init__(**{**kwargs, 'is_enabled': False})
+		self._log       = False
+		self._frozen    = True
+	
+	def __setattr__(self, name, value):
+		if self.__dict__.get('_frozen', False) == True:
+			raise AttributeError(f'DisabledUnitTest is read-only, "{name}" cannot be set')
+		
+		super().__setattr__(name, value)
+	
+	def __delattr__(self, name):
+		raise AttributeError(f'DisabledUnitTest is read-only, "{name}" cannot be deleted')
+	
+	def override(self, id, function, *args, **kwargs):
+		'''
+			Calling the real function: no test-class is ever executed by this instance
+		'''
+		
+		return function(*args, **kwargs)
+	
+	async def overrideAsync(self, id, function, *args, **kwargs):
+		'''
+			Calling the real function and awaiting it when it returns an awaitable
+		'''
+		
+		result = function(*args, **kwargs)
+		if inspect.isawaitable(result):
+			result = await result
+			
+		return result
@@ -1,20 +1,27 @@
+from unit_test_advanced.LayeredMemory import LayeredMemory
+
+
 class UnitTestAction(object):
 	
 	# Attribute to pass data from one class to another in the execution plan
-	_memory         : dict  = {}
+	_memory         : LayeredMemory
 	dependencies    : list
 	children        : list
 	
 	def __init__(self, memory, **kwargs):
-		self.memory = memory
+		if isinstance(memory, LayeredMemory) == False:
+			memory = LayeredMemory(memory, owner= type(self))
+		
+		self._memory = memory
 	
 	@property
 	def memory(self):
+		if '_memory' not in self.__dict__:
+			self._memory = LayeredMemory(owner= type(self))
+			
 		return self._memory
 	
 	@memory.setter
 	def memory(self, memory):
-		self._memory = {
-			**self._memory,
-			**memory,
-		}
+		# Only the keys passed are written, in the layer of this action
+		self.memory.update(memory)
@@ -1,36 +1,84 @@
-from unit_test_advanced.UnitTest import UnitTest
+from functools import wraps
+from unit_test_advanced.UnitTest import UnitTest, DisabledUnitTest
+
+# Injected in production when the caller does not pass any UnitTest
+_DISABLED_UT = DisabledUnitTest()
+
+
+def _resolveUTParameter(func, param_name):
+	'''
+		Resolving once, when the decorator is applied, the name of the UnitTest parameter and its position.
+		Returns (name, position, is_parameter, accepts_kwargs). The position is None when the parameter can only be passed as keyword
+	'''
+	
+	code        = func.__code__
+	list_args   = code.co_varnames[:code.co_argcount + code.co_kwonlyargcount]
+	
+	final_ut_param_name = 'UT'
+	if param_name is None:
+		if 'UT' not in list_args:
+			from typing import get_type_hints
+			try:
+				type_hints = get_type_hints(func)
+			except NameError:
+				# Forward references not resolvable yet
+				type_hints = func.__annotations__
+			
+			for _var, _type in type_hints.items():
+				if _type is UnitTest or _type == 'UnitTest':
+					final_ut_param_name = _var
+					break
+	else:
+		final_ut_param_name = param_name
+	
+	accepts_kwargs = bool(code.co_flags & 0x08)
+	if final_ut_param_name not in list_args:
+		return final_ut_param_name, None, False, accepts_kwargs
+	
+	index_ut = list_args.index(final_ut_param_name)
+	if index_ut >= code.co_argcount:
+		index_ut = None
+	
+	return final_ut_param_name, index_ut, True, accepts_kwargs
 
 
 def initUT(arg):
 	param_name = None
 	
 	def decorator(func):
-		def wrapper(*args, **kwargs):
-			
-			final_ut_param_name = 'UT'
-			list_args = func.__code__.co_varnames
-			if param_name is None:
-				if 'UT' not in list_args:
-					from typing import get_type_hints
-					for _var, _type in get_type_hints(func).items():
-						if _type is UnitTest:
-							final_ut_param_name = _var
-							break
-			else:
-				final_ut_param_name = param_name
-			
-			if final_ut_param_name in list_args:
-				args = list(args)
-				index_ut = list_args.index(final_ut_param_name)
-				
-				if len(args) - 1 >= index_ut:
+		final_ut_param_name, index_ut, is_parameter, accepts_kwargs = _resolveUTParameter(func, param_name)
+		
+		if is_parameter == False and accepts_kwargs == True:
+			# The UnitTest passed by the trigger of an execution plan ends up in **kwargs
+			return func
+		
+		elif is_parameter == False:
+			# The function does not take any UnitTest: dropping the one passed by the trigger of an execution plan
+			@wraps(func)
+			def wrapper(*args, **kwargs):
+				if final_ut_param_name in kwargs:
+					del kwargs[final_ut_param_name]
+				return func(*args, **kwargs)
+		
+		elif index_ut is None:
+			@wraps(func)
+			def wrapper(*args, **kwargs):
+				if final_ut_param_name not in kwargs:
+					kwargs[final_ut_param_name] = _DISABLED_UT
+				return func(*args, **kwargs)
+		
+		else:
+			@wraps(func)
+			def wrapper(*args, **kwargs):
+				if len(args) > index_ut:
 					if isinstance(args[index_ut], UnitTest) is False:
-						args.insert(index_ut, UnitTest())
+						args = (*args[:index_ut], _DISABLED_UT, *args[index_ut:])
 				
-				elif final_ut_param_name not in kwargs and final_ut_param_name in list_args:
-					kwargs[final_ut_param_name] = UnitTest()
-			
-			return func(*args, **kwargs)
+				elif final_ut_param_name not in kwargs:
+					kwargs[final_ut_param_name] = _DISABLED_UT
+				
+				return func(*args, **kwargs)
+		
 		return wrapper
 	
 	if callable(arg):
@@ -38,4 +86,4 @@ def initUT(arg):
 		return decorator(arg)
 	else:
 		param_name = arg
-		return decorator
\ No newline at end of file
+		return decorator